@@ -26,10 +26,8 @@ def parse_ebusd_info_target_addresses(lines: Sequence[str]) -> list[int]:
         m = _ADDR_LINE_RE.match(raw.strip())
         if not m:
             continue
-        try:
-            addr = int(m.group(1), 16)
-        except ValueError:
-            continue
+        # The regex only admits two hex digits, so int() cannot fail here.
+        addr = int(m.group(1), 16)
         rest = m.group(2).lower()
         if _ROLE_TARGET_TOKEN not in rest:
             continue
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import Final, Literal, cast
+from weakref import WeakValueDictionary
 
 
 class B524Error(Exception):
@@ -30,7 +31,7 @@ type DirectoryOpcode = Literal[0x00]
 type ConstraintOpcode = Literal[0x01]
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class B524DirectorySelector:
     """B524 directory probe selector (`00 <GG> 00`).
 
@@ -42,7 +43,7 @@ class B524DirectorySelector:
     group: int
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class B524ConstraintSelector:
     """B524 constraint selector (`01 <GG> <RR>`)."""
 
@@ -51,7 +52,7 @@ class B524ConstraintSelector:
     register: int
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class B524RegisterSelector:
     """B524 register selector for local (0x02) or remote (0x06) register spaces.
 
@@ -74,7 +75,7 @@ class B524RegisterSelector:
     register: int
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class B524TimerSelector:
     """B524 timer selector for read (0x03) or write (0x04) timer schedules.
 
@@ -102,6 +103,10 @@ _TIMER_SELECTOR_LEN: Final[int] = 5
 _DIRECTORY_SELECTOR_LEN: Final[int] = 3
 _CONSTRAINT_SELECTOR_LEN: Final[int] = 3
 
+# ebusd CSVs repeat the same selector across many message definitions; identical
+# payloads share one selector object for as long as any caller holds a reference.
+_SELECTOR_INTERN: WeakValueDictionary[bytes, B524IdSelector] = WeakValueDictionary()
+
 
 def parse_b524_id(id_hex: str) -> B524IdSelector:
     """Parse an ebusd CSV `b524` id selector into a structured representation.
@@ -146,6 +151,14 @@ def parse_b524_id(id_hex: str) -> B524IdSelector:
     if not payload:
         raise B524IdLengthError("B524 id payload is empty")
 
+    selector = _SELECTOR_INTERN.get(payload)
+    if selector is None:
+        selector = _selector_from_payload(payload)
+        _SELECTOR_INTERN[payload] = selector
+    return selector
+
+
+def _selector_from_payload(payload: bytes) -> B524IdSelector:
     opcode = payload[0]
 
     match opcode:
@@ -173,13 +186,12 @@ def parse_b524_id(id_hex: str) -> B524IdSelector:
                     f"got 0x{optype:02X}"
                 )
             optype_lit = cast(Literal[0x00, 0x01], optype)
-            register = int.from_bytes(payload[4:6], byteorder="little", signed=False)
             return B524RegisterSelector(
                 opcode=opcode,
                 optype=optype_lit,
                 group=payload[2],
                 instance=payload[3],
-                register=register,
+                register=payload[4] | (payload[5] << 8),
             )
 
         case 0x03 | 0x04:
@@ -214,16 +226,14 @@ def parse_b524_id(id_hex: str) -> B524IdSelector:
             raise B524UnknownOpcodeError(f"Unknown B524 opcode: 0x{opcode:02X}")
 
 
+# Builders sit on the scan hot path and callers are statically typed, so only the
+# range is checked here; non-int values still fail in the comparison or in bytes().
 def _validate_u8(field_name: str, value: int) -> None:
-    if not isinstance(value, int) or isinstance(value, bool):
-        raise TypeError(f"{field_name} must be an int, got {type(value).__name__}")
     if not (0x00 <= value <= 0xFF):
         raise ValueError(f"{field_name} must be in range 0..255, got {value}")
 
 
 def _validate_u16(field_name: str, value: int) -> None:
-    if not isinstance(value, int) or isinstance(value, bool):
-        raise TypeError(f"{field_name} must be an int, got {type(value).__name__}")
     if not (0x0000 <= value <= 0xFFFF):
         raise ValueError(f"{field_name} must be in range 0..65535, got {value}")
 
@@ -257,8 +267,9 @@ def build_constraint_probe_payload(group: int, register: int) -> bytes:
     - RR: register id (u8)
     """
 
-    _validate_u8("group", group)
-    _validate_u8("register", register)
+    if (group | register) & ~0xFF:
+        _validate_u8("group", group)
+        _validate_u8("register", register)
     return bytes((0x01, group, register))
 
 
@@ -282,10 +293,9 @@ def build_register_read_payload(
     if opcode not in (0x02, 0x06):
         raise ValueError(f"opcode must be 0x02 or 0x06, got 0x{opcode:02X}")
 
-    _validate_u8("group", group)
-    _validate_u8("instance", instance)
-    _validate_u16("register", register)
+    if (group | instance) & ~0xFF or register & ~0xFFFF:
+        _validate_u8("group", group)
+        _validate_u8("instance", instance)
+        _validate_u16("register", register)
 
-    return bytes((opcode, 0x00, group, instance)) + register.to_bytes(
-        2, byteorder="little", signed=False
-    )
+    return bytes((opcode, 0x00, group, instance, register & 0xFF, register >> 8))
@@ -2,7 +2,41 @@ from __future__ import annotations
 
 import math
 import struct
-from datetime import date
+from collections.abc import Callable
+from functools import lru_cache, partial
+from typing import Any
+
+# Precompiled fixed-width codecs; bound methods avoid re-parsing format strings per call.
+_F32 = struct.Struct("<f")
+_U16 = struct.Struct("<H")
+_I8 = struct.Struct("<b")
+_I16 = struct.Struct("<h")
+_U32 = struct.Struct("<I")
+_I32 = struct.Struct("<i")
+_f32_unpack = _F32.unpack
+_f32_pack = _F32.pack
+_u16_unpack = _U16.unpack
+_u16_pack = _U16.pack
+_i8_unpack = _I8.unpack
+_i8_pack = _I8.pack
+_i16_unpack = _I16.unpack
+_i16_pack = _I16.pack
+_u32_unpack = _U32.unpack
+_u32_pack = _U32.pack
+_i32_unpack = _I32.unpack
+_i32_pack = _I32.pack
+
+
+# Byte -> decoded BCD value, or _BCD_INVALID when either nibble is above 9.
+_BCD_INVALID = 0xFF
+_BCD_DECODE = bytes(
+    (b >> 4) * 10 + (b & 0xF) if (b >> 4) <= 9 and (b & 0xF) <= 9 else _BCD_INVALID
+    for b in range(256)
+)
+# Index 1..12; February is checked separately for leap years.
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+# 0..99 -> packed BCD byte.
+_BCD_ENCODE = bytes(((v // 10) << 4) | (v % 10) for v in range(100))
 
 
 class ValueParseError(Exception):
@@ -13,19 +47,17 @@ class ValueEncodeError(Exception):
     """Raised when a typed value cannot be encoded into bytes."""
 
 
-def _expect_len(type_spec: str, data: bytes, expected_len: int) -> None:
-    if len(data) != expected_len:
-        raise ValueParseError(f"{type_spec} expects {expected_len} bytes, got {len(data)} bytes")
+def _length_error(type_spec: str, data: bytes, expected_len: int) -> ValueParseError:
+    return ValueParseError(f"{type_spec} expects {expected_len} bytes, got {len(data)} bytes")
 
 
 def _decode_bcd(type_spec: str, field: str, value: int) -> int:
     """Decode a single byte containing a BCD-encoded decimal number."""
 
-    high = (value >> 4) & 0xF
-    low = value & 0xF
-    if high > 9 or low > 9:
+    decoded = _BCD_DECODE[value]
+    if decoded == _BCD_INVALID:
         raise ValueParseError(f"{type_spec} invalid BCD for {field}: 0x{value:02X}")
-    return high * 10 + low
+    return decoded
 
 
 def _encode_bcd(type_spec: str, field: str, value: int) -> int:
@@ -33,9 +65,7 @@ def _encode_bcd(type_spec: str, field: str, value: int) -> int:
 
     if not (0 <= value <= 99):
         raise ValueEncodeError(f"{type_spec} {field} must be 0..99, got {value}")
-    tens = value // 10
-    ones = value % 10
-    return (tens << 4) | ones
+    return _BCD_ENCODE[value]
 
 
 def parse_exp(data: bytes) -> float | None:
@@ -45,66 +75,75 @@ def parse_exp(data: bytes) -> float | None:
         - NaN values are returned as `None` so they can later be rendered as JSON `null`.
     """
 
-    _expect_len("EXP", data, 4)
-    value = struct.unpack("<f", data)[0]
-    if math.isnan(value):
+    if len(data) != 4:
+        raise _length_error("EXP", data, 4)
+    # float32 NaN: exponent bits all set and a non-zero mantissa.
+    if _u32_unpack(data)[0] & 0x7FFFFFFF > 0x7F800000:
         return None
-    return float(value)
+    return _f32_unpack(data)[0]
 
 
 def parse_uin(data: bytes) -> int:
     """Parse an `UIN` value (u16le)."""
 
-    _expect_len("UIN", data, 2)
-    return int.from_bytes(data, byteorder="little", signed=False)
+    if len(data) != 2:
+        raise _length_error("UIN", data, 2)
+    return _u16_unpack(data)[0]
 
 
 def parse_uch(data: bytes) -> int:
     """Parse an `UCH` value (u8)."""
 
-    _expect_len("UCH", data, 1)
+    if len(data) != 1:
+        raise _length_error("UCH", data, 1)
     return data[0]
 
 
 def parse_i8(data: bytes) -> int:
     """Parse an `I8` value (i8)."""
 
-    _expect_len("I8", data, 1)
-    return int.from_bytes(data, byteorder="little", signed=True)
+    if len(data) != 1:
+        raise _length_error("I8", data, 1)
+    return _i8_unpack(data)[0]
 
 
 def parse_i16(data: bytes) -> int:
     """Parse an `I16` value (i16le)."""
 
-    _expect_len("I16", data, 2)
-    return int.from_bytes(data, byteorder="little", signed=True)
+    if len(data) != 2:
+        raise _length_error("I16", data, 2)
+    return _i16_unpack(data)[0]
 
 
 def parse_u32(data: bytes) -> int:
     """Parse an `U32` value (u32le)."""
 
-    _expect_len("U32", data, 4)
-    return int.from_bytes(data, byteorder="little", signed=False)
+    if len(data) != 4:
+        raise _length_error("U32", data, 4)
+    return _u32_unpack(data)[0]
 
 
 def parse_i32(data: bytes) -> int:
     """Parse an `I32` value (i32le)."""
 
-    _expect_len("I32", data, 4)
-    return int.from_bytes(data, byteorder="little", signed=True)
+    if len(data) != 4:
+        raise _length_error("I32", data, 4)
+    return _i32_unpack(data)[0]
 
 
 def parse_bool(data: bytes) -> bool:
     """Parse a `BOOL` value (u8 -> bool)."""
 
-    _expect_len("BOOL", data, 1)
+    if len(data) != 1:
+        raise _length_error("BOOL", data, 1)
     return data[0] != 0x00
 
 
 def parse_hex(type_spec: str, data: bytes, expected_len: int) -> str:
     """Parse a `HEX:n` value as a hex string preserving byte order."""
 
-    _expect_len(type_spec, data, expected_len)
+    if len(data) != expected_len:
+        raise _length_error(type_spec, data, expected_len)
     return "0x" + data.hex()
 
 
@@ -128,7 +167,8 @@ def parse_hda3_date(data: bytes) -> str:
         `09 03 1A` means `2026-03-09` and `01 01 0F` means `2015-01-01`.
     """
 
-    _expect_len("HDA:3", data, 3)
+    if len(data) != 3:
+        raise _length_error("HDA:3", data, 3)
     day = data[0]
     month = data[1]
     year_2digit = data[2]
@@ -140,12 +180,10 @@ def parse_hda3_date(data: bytes) -> str:
         raise ValueParseError(f"HDA:3 year must be 0..99, got {year_2digit}")
 
     year = 2000 + year_2digit
-    try:
-        return date(year, month, day).isoformat()
-    except ValueError as exc:
-        raise ValueParseError(
-            f"HDA:3 invalid date DDMMYY={day:02d}{month:02d}{year_2digit:02d}"
-        ) from exc
+    # 2000..2099: every fourth year is a leap year (2000 is divisible by 400).
+    if day > _DAYS_IN_MONTH[month] and not (month == 2 and day == 29 and year % 4 == 0):
+        raise ValueParseError(f"HDA:3 invalid date DDMMYY={day:02d}{month:02d}{year_2digit:02d}")
+    return f"{year:04d}-{month:02d}-{day:02d}"
 
 
 def parse_hti_time(data: bytes) -> str:
@@ -155,16 +193,22 @@ def parse_hti_time(data: bytes) -> str:
         ISO-ish time string: `HH:MM:SS`.
     """
 
-    _expect_len("HTI", data, 3)
-    hour = _decode_bcd("HTI", "hour", data[0])
-    minute = _decode_bcd("HTI", "minute", data[1])
-    second = _decode_bcd("HTI", "second", data[2])
-
-    if hour > 23:
-        raise ValueParseError(f"HTI hour must be 0..23, got {hour}")
-    if minute > 59:
-        raise ValueParseError(f"HTI minute must be 0..59, got {minute}")
-    if second > 59:
+    if len(data) != 3:
+        raise _length_error("HTI", data, 3)
+    hour = _BCD_DECODE[data[0]]
+    minute = _BCD_DECODE[data[1]]
+    second = _BCD_DECODE[data[2]]
+
+    # Invalid BCD decodes to 0xFF, so one combined range test covers both failure
+    # modes; the per-field checks below only run to report the offending field.
+    if (hour > 23) | (minute > 59) | (second > 59):
+        hour = _decode_bcd("HTI", "hour", data[0])
+        minute = _decode_bcd("HTI", "minute", data[1])
+        second = _decode_bcd("HTI", "second", data[2])
+        if hour > 23:
+            raise ValueParseError(f"HTI hour must be 0..23, got {hour}")
+        if minute > 59:
+            raise ValueParseError(f"HTI minute must be 0..59, got {minute}")
         raise ValueParseError(f"HTI second must be 0..59, got {second}")
 
     return f"{hour:02d}:{minute:02d}:{second:02d}"
@@ -177,7 +221,8 @@ def parse_fw(data: bytes) -> str:
         Canonical firmware version string: `MM.mm.pp`.
     """
 
-    _expect_len("FW", data, 3)
+    if len(data) != 3:
+        raise _length_error("FW", data, 3)
     components: list[int] = []
     for field, raw in (("major", data[0]), ("minor", data[1]), ("patch", data[2])):
         try:
@@ -191,30 +236,34 @@ def parse_fw(data: bytes) -> str:
     return f"{major:02d}.{minor:02d}.{patch:02d}"
 
 
+# Exact type checks: `type(x) is int` rejects bool without a second isinstance call.
+_EXP_NUMERIC_TYPES = frozenset((int, float))
+
+
 def encode_exp(value: float) -> bytes:
     """Encode an `EXP` value (float32le)."""
 
-    if not isinstance(value, (int, float)) or isinstance(value, bool):
+    if type(value) not in _EXP_NUMERIC_TYPES:
         raise ValueEncodeError(f"EXP expects float, got {type(value).__name__}")
     if math.isnan(float(value)):
         raise ValueEncodeError("EXP cannot encode NaN")
-    return struct.pack("<f", float(value))
+    return _f32_pack(float(value))
 
 
 def encode_uin(value: int) -> bytes:
     """Encode an `UIN` value (u16le)."""
 
-    if not isinstance(value, int) or isinstance(value, bool):
+    if type(value) is not int:
         raise ValueEncodeError(f"UIN expects int, got {type(value).__name__}")
     if not (0 <= value <= 0xFFFF):
         raise ValueEncodeError(f"UIN out of range 0..65535, got {value}")
-    return int(value).to_bytes(2, byteorder="little", signed=False)
+    return _u16_pack(value)
 
 
 def encode_uch(value: int) -> bytes:
     """Encode an `UCH` value (u8)."""
 
-    if not isinstance(value, int) or isinstance(value, bool):
+    if type(value) is not int:
         raise ValueEncodeError(f"UCH expects int, got {type(value).__name__}")
     if not (0 <= value <= 0xFF):
         raise ValueEncodeError(f"UCH out of range 0..255, got {value}")
@@ -224,47 +273,47 @@ def encode_uch(value: int) -> bytes:
 def encode_i8(value: int) -> bytes:
     """Encode an `I8` value (i8)."""
 
-    if not isinstance(value, int) or isinstance(value, bool):
+    if type(value) is not int:
         raise ValueEncodeError(f"I8 expects int, got {type(value).__name__}")
     if not (-0x80 <= value <= 0x7F):
         raise ValueEncodeError(f"I8 out of range -128..127, got {value}")
-    return int(value).to_bytes(1, byteorder="little", signed=True)
+    return _i8_pack(value)
 
 
 def encode_i16(value: int) -> bytes:
     """Encode an `I16` value (i16le)."""
 
-    if not isinstance(value, int) or isinstance(value, bool):
+    if type(value) is not int:
         raise ValueEncodeError(f"I16 expects int, got {type(value).__name__}")
     if not (-0x8000 <= value <= 0x7FFF):
         raise ValueEncodeError(f"I16 out of range -32768..32767, got {value}")
-    return int(value).to_bytes(2, byteorder="little", signed=True)
+    return _i16_pack(value)
 
 
 def encode_u32(value: int) -> bytes:
     """Encode an `U32` value (u32le)."""
 
-    if not isinstance(value, int) or isinstance(value, bool):
+    if type(value) is not int:
         raise ValueEncodeError(f"U32 expects int, got {type(value).__name__}")
     if not (0 <= value <= 0xFFFFFFFF):
         raise ValueEncodeError(f"U32 out of range 0..4294967295, got {value}")
-    return int(value).to_bytes(4, byteorder="little", signed=False)
+    return _u32_pack(value)
 
 
 def encode_i32(value: int) -> bytes:
     """Encode an `I32` value (i32le)."""
 
-    if not isinstance(value, int) or isinstance(value, bool):
+    if type(value) is not int:
         raise ValueEncodeError(f"I32 expects int, got {type(value).__name__}")
     if not (-0x80000000 <= value <= 0x7FFFFFFF):
         raise ValueEncodeError(f"I32 out of range -2147483648..2147483647, got {value}")
-    return int(value).to_bytes(4, byteorder="little", signed=True)
+    return _i32_pack(value)
 
 
 def encode_bool(value: bool) -> bytes:
     """Encode a `BOOL` value as a single u8 byte."""
 
-    if not isinstance(value, bool):
+    if type(value) is not bool:
         raise ValueEncodeError(f"BOOL expects bool, got {type(value).__name__}")
     return b"\x01" if value else b"\x00"
 
@@ -361,46 +410,146 @@ def encode_fw(value: str) -> bytes:
     )
 
 
+# Schemas use a small, fixed vocabulary of type specs, so these memo tables stay tiny.
+_NORMALIZED_TYPE_SPECS: dict[str, str] = {}
+_HEX_TYPE_LENS: dict[str, int] = {}
+
+
+def _normalize_type_spec(type_spec: str) -> str:
+    normalized = _NORMALIZED_TYPE_SPECS.get(type_spec)
+    if normalized is None:
+        normalized = _NORMALIZED_TYPE_SPECS[type_spec] = type_spec.strip().upper()
+    return normalized
+
+
+def _hex_type_len(normalized: str) -> int:
+    """Return the byte length of a normalized `HEX:n` spec (raises `ValueError`)."""
+
+    expected = _HEX_TYPE_LENS.get(normalized)
+    if expected is None:
+        expected = _HEX_TYPE_LENS[normalized] = int(normalized[4:], 10)
+    return expected
+
+
+_FIXED_VALUE_LENGTHS: dict[str, int] = {
+    "EXP": 4,
+    "UIN": 2,
+    "UCH": 1,
+    "I8": 1,
+    "I16": 2,
+    "U32": 4,
+    "I32": 4,
+    "BOOL": 1,
+    "HDA:3": 3,
+    "HTI": 3,
+    "FW": 3,
+}
+
+
+def fixed_value_length(type_spec: str) -> int | None:
+    """Return the encoded byte length of a fixed-width type spec.
+
+    Returns `None` for variable-length (`STR:*`), unknown, or malformed specs.
+    """
+
+    length = _FIXED_VALUE_LENGTHS.get(type_spec)
+    if length is not None:
+        return length
+    normalized = _normalize_type_spec(type_spec)
+    if normalized.startswith("HEX:"):
+        try:
+            return _hex_type_len(normalized)
+        except ValueError:
+            return None
+    return _FIXED_VALUE_LENGTHS.get(normalized)
+
+
+_ENCODERS: dict[str, Callable[[Any], bytes]] = {
+    "EXP": encode_exp,
+    "UIN": encode_uin,
+    "UCH": encode_uch,
+    "I8": encode_i8,
+    "I16": encode_i16,
+    "U32": encode_u32,
+    "I32": encode_i32,
+    "BOOL": encode_bool,
+    "HDA:3": encode_hda3_date,
+    "HTI": encode_hti_time,
+    "FW": encode_fw,
+}
+
+
 def encode_typed_value(type_spec: str, value: object) -> bytes:
     """Encode a typed value into bytes compatible with ebusd schema type specs."""
 
-    normalized = type_spec.strip().upper()
+    encoder = _ENCODERS.get(type_spec)
+    if encoder is not None:
+        return encoder(value)
+
+    normalized = _normalize_type_spec(type_spec)
 
     if normalized.startswith("STR:"):
         return encode_str_cstring(value)  # type: ignore[arg-type]
 
     if normalized.startswith("HEX:"):
         try:
-            expected = int(normalized.split(":", 1)[1], 10)
+            expected = _hex_type_len(normalized)
         except ValueError as exc:
             raise ValueEncodeError(f"Invalid HEX length in type spec: {type_spec!r}") from exc
         return encode_hex(normalized, value, expected_len=expected)  # type: ignore[arg-type]
 
-    match normalized:
-        case "EXP":
-            return encode_exp(value)  # type: ignore[arg-type]
-        case "UIN":
-            return encode_uin(value)  # type: ignore[arg-type]
-        case "UCH":
-            return encode_uch(value)  # type: ignore[arg-type]
-        case "I8":
-            return encode_i8(value)  # type: ignore[arg-type]
-        case "I16":
-            return encode_i16(value)  # type: ignore[arg-type]
-        case "U32":
-            return encode_u32(value)  # type: ignore[arg-type]
-        case "I32":
-            return encode_i32(value)  # type: ignore[arg-type]
-        case "BOOL":
-            return encode_bool(value)  # type: ignore[arg-type]
-        case "HDA:3":
-            return encode_hda3_date(value)  # type: ignore[arg-type]
-        case "HTI":
-            return encode_hti_time(value)  # type: ignore[arg-type]
-        case "FW":
-            return encode_fw(value)  # type: ignore[arg-type]
-        case _:
-            raise ValueEncodeError(f"Unknown type spec: {type_spec!r}")
+    encoder = _ENCODERS.get(normalized)
+    if encoder is None:
+        raise ValueEncodeError(f"Unknown type spec: {type_spec!r}")
+    return encoder(value)
+
+
+_PARSERS: dict[str, Callable[[bytes], object]] = {
+    "EXP": parse_exp,
+    "UIN": parse_uin,
+    "UCH": parse_uch,
+    "I8": parse_i8,
+    "I16": parse_i16,
+    "U32": parse_u32,
+    "I32": parse_i32,
+    "BOOL": parse_bool,
+    "HDA:3": parse_hda3_date,
+    "HTI": parse_hti_time,
+    "FW": parse_fw,
+}
+
+
+@lru_cache(maxsize=64)
+def typed_value_parser(type_spec: str) -> Callable[[bytes], object]:
+    """Resolve a type spec once into a parser callable with its arguments bound.
+
+    Callers decoding many values of the same type can hoist the returned callable
+    out of their loop; `parse_typed_value` uses it for non-canonical specs.
+
+    Raises:
+        ValueParseError: On unknown or malformed type specs.
+    """
+
+    parser = _PARSERS.get(type_spec)
+    if parser is not None:
+        return parser
+
+    normalized = _normalize_type_spec(type_spec)
+
+    if normalized.startswith("STR:"):
+        return parse_str_cstring
+
+    if normalized.startswith("HEX:"):
+        try:
+            expected = _hex_type_len(normalized)
+        except ValueError as exc:
+            raise ValueParseError(f"Invalid HEX length in type spec: {type_spec!r}") from exc
+        return partial(parse_hex, normalized, expected_len=expected)
+
+    parser = _PARSERS.get(normalized)
+    if parser is None:
+        raise ValueParseError(f"Unknown type spec: {type_spec!r}")
+    return parser
 
 
 def parse_typed_value(type_spec: str, data: bytes) -> object:
@@ -428,40 +577,7 @@ def parse_typed_value(type_spec: str, data: bytes) -> object:
         ValueParseError: On unknown type, wrong length, or malformed values.
     """
 
-    normalized = type_spec.strip().upper()
-
-    if normalized.startswith("STR:"):
-        return parse_str_cstring(data)
-
-    if normalized.startswith("HEX:"):
-        try:
-            expected = int(normalized.split(":", 1)[1], 10)
-        except ValueError as exc:
-            raise ValueParseError(f"Invalid HEX length in type spec: {type_spec!r}") from exc
-        return parse_hex(normalized, data, expected_len=expected)
-
-    match normalized:
-        case "EXP":
-            return parse_exp(data)
-        case "UIN":
-            return parse_uin(data)
-        case "UCH":
-            return parse_uch(data)
-        case "I8":
-            return parse_i8(data)
-        case "I16":
-            return parse_i16(data)
-        case "U32":
-            return parse_u32(data)
-        case "I32":
-            return parse_i32(data)
-        case "BOOL":
-            return parse_bool(data)
-        case "HDA:3":
-            return parse_hda3_date(data)
-        case "HTI":
-            return parse_hti_time(data)
-        case "FW":
-            return parse_fw(data)
-        case _:
-            raise ValueParseError(f"Unknown type spec: {type_spec!r}")
+    parser = _PARSERS.get(type_spec)
+    if parser is None:
+        parser = typed_value_parser(type_spec)
+    return parser(data)
@@ -5,7 +5,7 @@ from datetime import UTC, datetime
 from typing import Any, Protocol, TypedDict
 
 from ..protocol.b509 import build_b509_register_read_payload
-from ..protocol.parser import ValueParseError, parse_typed_value
+from ..protocol.parser import ValueParseError, fixed_value_length, parse_typed_value
 from ..schema.ebusd_csv import EbusdCsvSchema
 from ..transport.base import TransportCommandNotEnabled, TransportError, TransportTimeout
 from .observer import ScanObserver
@@ -36,6 +36,10 @@ class B509RegisterEntry(TypedDict):
     myvaillant_name: str | None
 
 
+_B509_STATUS_BYTES = frozenset((0x00, 0x01, 0x02, 0x03))
+_B509_STATUS_PREFIX = "B509 read RR="
+
+
 def _hex_u16(value: int) -> str:
     return f"0x{value:04x}"
 
@@ -49,24 +53,19 @@ def _emit_trace_label(transport: _B509Transport, label: str) -> None:
 def _parse_b509_value(type_hint: str, response: bytes) -> tuple[object | None, str | None]:
     """Decode a B509 value using the schema type hint.
 
-    Some B509 replies carry a leading status byte. We first try decoding the whole payload,
-    then (if applicable) decoding without the first status-like byte.
+    Some B509 replies carry a leading status byte. For fixed-width types the reply
+    length tells us whether it is present, so the value is decoded exactly once.
     """
 
-    decode_candidates: list[bytes] = [response]
-    if len(response) > 1 and response[0] in {0x00, 0x01, 0x02, 0x03}:
-        decode_candidates.append(response[1:])
+    candidate = response
+    expected = fixed_value_length(type_hint)
+    if expected is not None and len(response) == expected + 1 and response[0] in _B509_STATUS_BYTES:
+        candidate = response[1:]
 
-    first_error: ValueParseError | None = None
-    for candidate in decode_candidates:
-        try:
-            return parse_typed_value(type_hint, candidate), None
-        except ValueParseError as exc:
-            if first_error is None:
-                first_error = exc
-
-    assert first_error is not None
-    return None, f"parse_error: {first_error}"
+    try:
+        return parse_typed_value(type_hint, candidate), None
+    except ValueParseError as exc:
+        return None, f"parse_error: {exc}"
 
 
 def parse_b509_range(spec: str) -> tuple[int, int]:
@@ -122,6 +121,7 @@ def scan_b509(
     incomplete_reason: str | None = None
 
     merged_ranges = merge_b509_ranges(ranges)
+    dst_key = f"0x{dst:02x}"
     total_reads = sum((end - start + 1) for start, end in merged_ranges)
     artifact: dict[str, Any] = {
         "meta": {
@@ -132,10 +132,10 @@ def scan_b509(
             "error_count": 0,
             "incomplete": False,
         },
-        "devices": {f"0x{dst:02x}": {"registers": {}}},
+        "devices": {dst_key: {"registers": {}}},
     }
 
-    registers = artifact["devices"][f"0x{dst:02x}"]["registers"]
+    registers = artifact["devices"][dst_key]["registers"]
 
     try:
         if observer is not None:
@@ -144,9 +144,16 @@ def scan_b509(
 
         for start, end in merged_ranges:
             _emit_trace_label(transport, f"B509 range {_hex_u16(start)}..{_hex_u16(end)}")
+            hex_names = [_hex_u16(register) for register in range(start, end + 1)]
+            schema_entries = (
+                ebusd_schema.lookup_b509_range(start, end)
+                if ebusd_schema is not None
+                else [None] * (end - start + 1)
+            )
             for register in range(start, end + 1):
+                register_key = hex_names[register - start]
                 if observer is not None:
-                    observer.status(f"B509 read RR={_hex_u16(register)}")
+                    observer.status(_B509_STATUS_PREFIX + register_key)
                     observer.phase_advance("b509_dump", advance=1)
 
                 reply_hex: str | None = None
@@ -163,11 +170,7 @@ def scan_b509(
                     reply_hex = response.hex()
                     raw_hex = reply_hex
 
-                    schema_entry = (
-                        ebusd_schema.lookup_b509(register=register)
-                        if ebusd_schema is not None
-                        else None
-                    )
+                    schema_entry = schema_entries[register - start]
                     if schema_entry is not None:
                         ebusd_name = schema_entry.name
                         if schema_entry.type_spec:
@@ -184,8 +187,8 @@ def scan_b509(
                 if error is not None:
                     error_count += 1
 
-                registers[_hex_u16(register)] = B509RegisterEntry(
-                    addr=_hex_u16(register),
+                registers[register_key] = B509RegisterEntry(
+                    addr=register_key,
                     op="0x09",
                     reply_hex=reply_hex,
                     raw_hex=raw_hex,
@@ -17,6 +17,10 @@ from .observer import ScanObserver
 
 logger = logging.getLogger(__name__)
 _KNOWN_GROUP_DISCOVERY_RETRIES: Final[int] = 2
+_F32_LE: Final = struct.Struct("<f")
+_DIRECTORY_PROBE_PAYLOADS: Final[tuple[bytes, ...]] = tuple(
+    build_directory_probe_payload(gg) for gg in range(0x100)
+)
 
 
 class GroupConfig(TypedDict):
@@ -290,7 +294,7 @@ def _parse_directory_descriptor(resp: bytes, group: int) -> float:
             "Short directory probe response: "
             f"expected >=4 bytes, got {len(resp)} bytes for GG=0x{group:02X}"
         )
-    return cast(float, struct.unpack("<f", resp[:4])[0])
+    return cast(float, _F32_LE.unpack_from(resp)[0])
 
 
 def _directory_probe_retry_budget(group: int) -> int:
@@ -320,7 +324,7 @@ def discover_groups(
         if observer is not None:
             observer.status(f"Directory probe GG=0x{gg:02X}")
             observer.phase_advance("group_discovery", advance=1)
-        payload = build_directory_probe_payload(gg)
+        payload = _DIRECTORY_PROBE_PAYLOADS[gg]
         attempts = _directory_probe_retry_budget(gg)
         descriptor: float | None = None
         skip_group = False
@@ -453,8 +457,10 @@ def classify_groups(
     """
 
     classified: list[ClassifiedGroup] = []
+    get_config = GROUP_CONFIG.get
+    observer_log = observer.log if observer is not None else None
     for group in discovered:
-        config = GROUP_CONFIG.get(group.group)
+        config = get_config(group.group)
         if config is None:
             classified.append(
                 ClassifiedGroup(
@@ -476,8 +482,8 @@ def classify_groups(
                 expected,
                 group.descriptor,
             )
-            if observer is not None:
-                observer.log(
+            if observer_log is not None:
+                observer_log(
                     f"Descriptor mismatch for GG=0x{group.group:02X}: "
                     f"expected {expected}, got {group.descriptor}",
                     level="info",
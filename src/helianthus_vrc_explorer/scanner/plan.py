@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-import string
-from collections.abc import Sequence
-from dataclasses import dataclass
+import re
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from itertools import product
 
 from ..protocol.b524 import RegisterOpcode
 from .identity import NamespaceIdentity, make_namespace_identity
 
-_HEX_DIGITS = set(string.hexdigits)
+_HEX_TOKEN_RE = re.compile(r"[0-9A-Fa-f]+")
 PlanKey = NamespaceIdentity
 
 
@@ -29,7 +30,7 @@ def parse_int_token(token: str) -> int:
         return int(lowered, 16)
     if raw.isdigit():
         return int(raw, 10)
-    if all(ch in _HEX_DIGITS for ch in raw):
+    if _HEX_TOKEN_RE.fullmatch(raw):
         return int(raw, 16)
     raise ValueError(f"Invalid integer token: {token!r}")
 
@@ -46,7 +47,7 @@ def parse_int_set(spec: str, *, min_value: int, max_value: int) -> list[int]:
     if min_value > max_value:
         raise ValueError("min_value must be <= max_value")
 
-    result: set[int] = set()
+    intervals: list[tuple[int, int]] = []
     raw = spec.strip()
     if not raw:
         raise ValueError("Empty set specification")
@@ -57,39 +58,32 @@ def parse_int_set(spec: str, *, min_value: int, max_value: int) -> list[int]:
             continue
         # VE23-R3: Support ".." as the primary range separator (unambiguous for hex).
         # Fall back to "-" only when ".." is absent.
-        if ".." in token:
-            start_s, end_s = token.split("..", 1)
+        if ".." in token or "-" in token:
+            start_s, end_s = token.split(".." if ".." in token else "-", 1)
             start = parse_int_token(start_s)
             end = parse_int_token(end_s)
             if start > end:
                 start, end = end, start
-            for value in range(start, end + 1):
-                if value < min_value or value > max_value:
-                    raise ValueError(
-                        f"Value out of range: {value} (allowed {min_value}-{max_value})"
-                    )
-                result.add(value)
-            continue
-        if "-" in token:
-            start_s, end_s = token.split("-", 1)
-            start = parse_int_token(start_s)
-            end = parse_int_token(end_s)
-            if start > end:
-                start, end = end, start
-            for value in range(start, end + 1):
-                if value < min_value or value > max_value:
-                    raise ValueError(
-                        f"Value out of range: {value} (allowed {min_value}-{max_value})"
-                    )
-                result.add(value)
-            continue
-
-        value = parse_int_token(token)
-        if value < min_value or value > max_value:
+        else:
+            start = end = parse_int_token(token)
+        # Report the first out-of-range value the range would have produced.
+        if start < min_value:
+            raise ValueError(f"Value out of range: {start} (allowed {min_value}-{max_value})")
+        if end > max_value:
+            value = max(start, max_value + 1)
             raise ValueError(f"Value out of range: {value} (allowed {min_value}-{max_value})")
-        result.add(value)
-
-    return sorted(result)
+        intervals.append((start, end))
+
+    # De-duplicate by merging sorted intervals instead of hashing every covered value.
+    intervals.sort()
+    result: list[int] = []
+    merged_end = min_value - 1
+    for start, end in intervals:
+        if end <= merged_end:
+            continue
+        result.extend(range(max(start, merged_end + 1), end + 1))
+        merged_end = end
+    return result
 
 
 def format_int_set(values: Sequence[int]) -> str:
@@ -123,7 +117,12 @@ def format_int_set(values: Sequence[int]) -> str:
     return ",".join(parts)
 
 
+_HEX_U8: tuple[str, ...] = tuple(f"0x{value:02x}" for value in range(0x100))
+
+
 def _hex_u8(value: int) -> str:
+    if 0x00 <= value <= 0xFF:
+        return _HEX_U8[value]
     return f"0x{value:02x}"
 
 
@@ -146,6 +145,11 @@ class GroupScanPlan:
     opcode: RegisterOpcode
     rr_max: int
     instances: tuple[int, ...]
+    # Derived once at construction; planners re-estimate on every redraw.
+    request_count: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "request_count", len(self.instances) * (self.rr_max + 1))
 
     def to_meta(self) -> dict[str, object]:
         return {
@@ -163,39 +167,45 @@ class RegisterTask:
     register: int
 
 
-def build_work_queue(
+def iter_work_queue(
     plan: dict[PlanKey, GroupScanPlan],
     *,
     done: set[RegisterTask],
-) -> list[RegisterTask]:
-    """Build the remaining register-scan task list in deterministic order."""
+) -> Iterator[RegisterTask]:
+    """Yield the remaining register-scan tasks lazily, in deterministic order.
+
+    `done` is snapshotted when iteration starts; later additions are not observed.
+    """
 
-    tasks: list[RegisterTask] = []
+    # Test membership on plain tuples so skipped tasks never allocate a RegisterTask.
+    done_keys = {(t.group, t.opcode, t.instance, t.register) for t in done}
     for key in sorted(plan.keys()):
         group_plan = plan[key]
         if key != make_plan_key(group_plan.group, group_plan.opcode):
             raise ValueError(
                 f"Plan key mismatch: key={key!r} entry={(group_plan.group, group_plan.opcode)!r}"
             )
-        for ii in group_plan.instances:
-            for rr in range(0x0000, group_plan.rr_max + 1):
-                task = RegisterTask(
-                    group=group_plan.group,
-                    opcode=group_plan.opcode,
-                    instance=ii,
-                    register=rr,
-                )
-                if task in done:
-                    continue
-                tasks.append(task)
-    return tasks
+        group = group_plan.group
+        opcode = group_plan.opcode
+        yield from (
+            RegisterTask(group, opcode, ii, rr)
+            for ii, rr in product(group_plan.instances, range(0x0000, group_plan.rr_max + 1))
+            if (group, opcode, ii, rr) not in done_keys
+        )
+
+
+def build_work_queue(
+    plan: dict[PlanKey, GroupScanPlan],
+    *,
+    done: set[RegisterTask],
+) -> list[RegisterTask]:
+    """Build the remaining register-scan task list in deterministic order."""
+
+    return list(iter_work_queue(plan, done=done))
 
 
 def estimate_register_requests(plan: dict[PlanKey, GroupScanPlan]) -> int:
-    total = 0
-    for group_plan in plan.values():
-        total += len(group_plan.instances) * (group_plan.rr_max + 1)
-    return total
+    return sum(group_plan.request_count for group_plan in plan.values())
 
 
 def estimate_eta_seconds(*, requests: int, request_rate_rps: float | None) -> float | None:
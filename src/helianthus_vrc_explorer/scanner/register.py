@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Final, Literal, NotRequired, TypedDict, cast
 
 from ..protocol.b524 import RegisterOpcode, build_register_read_payload
-from ..protocol.parser import ValueParseError, parse_typed_value
+from ..protocol.parser import ValueParseError, typed_value_parser
 from ..transport.base import (
     TransportCommandNotEnabled,
     TransportError,
@@ -19,12 +20,53 @@ from .identity import make_register_identity, operation_label
 
 logger = logging.getLogger(__name__)
 
-_PRINTABLE_LATIN1: Final[set[int]] = set(range(0x20, 0x7F)) | set(range(0xA0, 0x100))
+# Printable latin1 bytes, used as a bytes.translate() deletion table: stripping
+# them leaves only the offending bytes, so the check runs in C.
+_PRINTABLE_LATIN1: Final[bytes] = bytes(range(0x20, 0x7F)) + bytes(range(0xA0, 0x100))
 _I32_INVALID_SENTINEL: Final[int] = 0x7FFFFFFF
 _I32_INVALID_SENTINEL_RAW_HEX: Final[str] = "ffffff7f"
 # VE24-R3: U32 sentinel — same raw pattern, different semantic type.
 _U32_INVALID_SENTINEL: Final[int] = 0xFFFFFFFF
 _U32_INVALID_SENTINEL_RAW_HEX: Final[str] = "ffffffff"
+# Candidate type specs tried, in order, for schema-less replies of a given length,
+# with their parsers resolved once at import.
+_INFERRED_SPECS: Final[dict[int, tuple[tuple[str, Callable[[bytes], object]], ...]]] = {
+    n: tuple((spec, typed_value_parser(spec)) for spec in specs)
+    for n, specs in (
+        (1, ("UCH",)),
+        (2, ("UIN",)),
+        (3, ("HDA:3", "HTI")),
+        (4, ("EXP",)),
+    )
+}
+_PARSE_CSTRING: Final[Callable[[bytes], object]] = typed_value_parser("STR:*")
+# FLAGS byte (0..3) lookups; bit1 = config vs simple, bit0 meaning depends on opcode.
+_LOCAL_FLAGS_ACCESS: Final[tuple[str, ...]] = (
+    "state_volatile",
+    "state_stable",
+    "config_installer",
+    "config_user",
+)
+_REMOTE_FLAGS_ACCESS: Final[tuple[str, ...]] = (
+    "invalid",
+    "valid",
+    "config_sentinel",
+    "config_valid",
+)
+# Local namespace: bit0 indicates stable vs volatile.
+_LOCAL_REPLY_KINDS: Final[tuple[str, ...]] = (
+    "simple_volatile",
+    "simple_stable",
+    "config_volatile",
+    "config_stable",
+)
+# Remote namespace: bit0 indicates validity vs sentinel/invalid payload.
+_REMOTE_REPLY_KINDS: Final[tuple[str, ...]] = (
+    "simple_invalid",
+    "simple_valid",
+    "config_invalid",
+    "config_valid",
+)
 _REMOTE_HEADER_PROBE_REGISTERS: Final[tuple[tuple[int, str], ...]] = (
     (0x0001, "BOOL"),
     (0x0002, "UCH"),
@@ -75,6 +117,37 @@ class RegisterEntry(TypedDict):
     value_display: NotRequired[str]
 
 
+# Blank entry that every read_register() result is derived from via `|`.
+_EMPTY_ENTRY: Final[RegisterEntry] = {
+    "read_opcode": "",
+    "read_opcode_label": "",
+    "reply_hex": None,
+    "flags": None,
+    "reply_kind": None,
+    "flags_access": None,
+    "response_state": None,
+    "ebusd_name": None,
+    "myvaillant_name": None,
+    "raw_hex": None,
+    "type": None,
+    "value": None,
+    "error": None,
+}
+
+
+def _entry_template(opcode: int) -> RegisterEntry:
+    return _EMPTY_ENTRY | {
+        "read_opcode": f"0x{opcode:02x}",
+        "read_opcode_label": operation_label(opcode=opcode, optype=0x00),
+    }
+
+
+# Per-opcode templates, built once instead of formatting the opcode labels per read.
+_ENTRY_TEMPLATES: Final[dict[int, RegisterEntry]] = {
+    opcode: _entry_template(opcode) for opcode in (0x02, 0x06)
+}
+
+
 @dataclass(frozen=True, slots=True)
 class NamespaceAvailabilityContract:
     source: Literal["heuristic_probe", "always_present"]
@@ -265,30 +338,11 @@ def _interpret_flags(flags: int, *, response_len: int, opcode: int = 0x02) -> st
             return "absent"
         return "unknown_status"
 
+    if not 0 <= flags <= 0x03:
+        return "unknown"
     if opcode == 0x06:
-        match flags:
-            case 0x00:
-                return "invalid"
-            case 0x01:
-                return "valid"
-            case 0x02:
-                return "config_sentinel"
-            case 0x03:
-                return "config_valid"
-            case _:
-                return "unknown"
-
-    match flags:
-        case 0x00:
-            return "state_volatile"
-        case 0x01:
-            return "state_stable"
-        case 0x02:
-            return "config_installer"
-        case 0x03:
-            return "config_user"
-        case _:
-            return "unknown"
+        return _REMOTE_FLAGS_ACCESS[flags]
+    return _LOCAL_FLAGS_ACCESS[flags]
 
 
 def _reply_kind(
@@ -303,16 +357,11 @@ def _reply_kind(
         return None
     if response_len == 1:
         return None
-    if flags not in {0x00, 0x01, 0x02, 0x03}:
+    if not 0 <= flags <= 0x03:
         return None
-    class_kind = "config" if flags & 0x02 else "simple"
     if opcode == 0x06:
-        # Remote namespace: bit0 indicates validity vs sentinel/invalid payload.
-        value_kind = "valid" if flags & 0x01 else "invalid"
-        return f"{class_kind}_{value_kind}"
-    # Local namespace: bit0 indicates stable vs volatile.
-    value_kind = "stable" if flags & 0x01 else "volatile"
-    return f"{class_kind}_{value_kind}"
+        return _REMOTE_REPLY_KINDS[flags]
+    return _LOCAL_REPLY_KINDS[flags]
 
 
 def _looks_like_nul_terminated_latin1(value_bytes: bytes) -> bool:
@@ -323,22 +372,16 @@ def _looks_like_nul_terminated_latin1(value_bytes: bytes) -> bool:
     packed binary values.
     """
 
-    if not value_bytes:
-        return False
-
-    try:
-        nul_index = value_bytes.index(0x00)
-    except ValueError:
+    nul_index = value_bytes.find(0x00)
+    if nul_index <= 0:
+        # No NUL at all, or an empty string before it.
         return False
 
     # After the first NUL, allow only more NUL padding.
-    if any(b != 0x00 for b in value_bytes[nul_index:]):
+    if value_bytes.count(0x00, nul_index) != len(value_bytes) - nul_index:
         return False
 
-    prefix = value_bytes[:nul_index]
-    if not prefix:
-        return False
-    return all(b in _PRINTABLE_LATIN1 for b in prefix)
+    return not value_bytes[:nul_index].translate(None, _PRINTABLE_LATIN1)
 
 
 def _strip_echo_header(payload: bytes, response: bytes) -> bytes:
@@ -367,17 +410,14 @@ def _strip_echo_header(payload: bytes, response: bytes) -> bytes:
 
     if len(response) < 4:
         raise ValueError(f"Short register response: expected >=4 bytes, got {len(response)} bytes")
-    header = response[:4]
-
-    expected_group = payload[2]
-    expected_rr = payload[4:6]
-    group = header[1]
-    rr = header[2:4]
-    if group != expected_group or rr != expected_rr:
+    # Compare (GG, RR_LO, RR_HI) as one packed integer; slices are only built for errors.
+    expected = (payload[2] << 16) | (payload[4] << 8) | payload[5]
+    got = (response[1] << 16) | (response[2] << 8) | response[3]
+    if got != expected:
         raise ValueError(
             "Register header mismatch: "
-            f"expected_gg={expected_group:02x} expected_rr={expected_rr.hex()} "
-            f"got={header.hex()} payload={payload.hex()}"
+            f"expected_gg={payload[2]:02x} expected_rr={payload[4:6].hex()} "
+            f"got={response[:4].hex()} payload={payload.hex()}"
         )
     return response[4:]
 
@@ -393,44 +433,21 @@ def _parse_inferred_value(value_bytes: bytes) -> tuple[str | None, object | None
     if n == 0:
         return None, None, None
 
-    def _hex_fallback() -> tuple[str, object, None]:
-        spec = f"HEX:{n}"
-        return spec, parse_typed_value(spec, value_bytes), None
-
-    if len(value_bytes) == 4:
+    for spec, parser in _INFERRED_SPECS.get(n, ()):
         try:
-            return "EXP", parse_typed_value("EXP", value_bytes), None
+            return spec, parser(value_bytes), None
         except ValueParseError:
-            # Don't drop bytes on the floor: keep a stable representation.
-            return _hex_fallback()
+            continue
 
-    if len(value_bytes) == 2:
+    if n > 4 and _looks_like_nul_terminated_latin1(value_bytes):
         try:
-            return "UIN", parse_typed_value("UIN", value_bytes), None
+            return "STR:*", _PARSE_CSTRING(value_bytes), None
         except ValueParseError:
-            return _hex_fallback()
+            pass
 
-    if len(value_bytes) == 1:
-        try:
-            return "UCH", parse_typed_value("UCH", value_bytes), None
-        except ValueParseError:
-            return _hex_fallback()
-
-    if len(value_bytes) == 3:
-        for spec in ("HDA:3", "HTI"):
-            try:
-                return spec, parse_typed_value(spec, value_bytes), None
-            except ValueParseError:
-                continue
-        return _hex_fallback()
-
-    if _looks_like_nul_terminated_latin1(value_bytes):
-        try:
-            return "STR:*", parse_typed_value("STR:*", value_bytes), None
-        except ValueParseError:
-            return _hex_fallback()
-
-    return _hex_fallback()
+    # Don't drop bytes on the floor: keep a stable representation.
+    spec = f"HEX:{n}"
+    return spec, typed_value_parser(spec)(value_bytes), None
 
 
 def _sentinel_value_display(
@@ -470,8 +487,9 @@ def read_register(
     register_key = make_register_identity(
         opcode=opcode, group=group, instance=instance, register=register
     )
-    read_opcode = f"0x{opcode:02x}"
-    read_opcode_label = operation_label(opcode=opcode, optype=0x00)
+    base = _ENTRY_TEMPLATES.get(opcode)
+    if base is None:
+        base = _entry_template(opcode)
     emit_trace_label(
         transport,
         "Reading "
@@ -483,176 +501,62 @@ def read_register(
     try:
         response = transport.send(dst, payload)
     except TransportNack:
-        return {
-            "read_opcode": read_opcode,
-            "read_opcode_label": read_opcode_label,
-            "reply_hex": None,
-            "flags": None,
-            "reply_kind": None,
-            "flags_access": None,
-            "response_state": "nack",
-            "ebusd_name": None,
-            "myvaillant_name": None,
-            "raw_hex": None,
-            "type": None,
-            "value": None,
-            "error": "nack",
-        }
+        return base | {"response_state": "nack", "error": "nack"}
     except TransportTimeout:
-        return {
-            "read_opcode": read_opcode,
-            "read_opcode_label": read_opcode_label,
-            "reply_hex": None,
-            "flags": None,
-            "reply_kind": None,
-            "flags_access": None,
-            "response_state": "timeout",
-            "ebusd_name": None,
-            "myvaillant_name": None,
-            "raw_hex": None,
-            "type": None,
-            "value": None,
-            "error": "timeout",
-        }
+        return base | {"response_state": "timeout", "error": "timeout"}
     except TransportError as exc:
         if isinstance(exc, TransportCommandNotEnabled):
             raise
-        return {
-            "read_opcode": read_opcode,
-            "read_opcode_label": read_opcode_label,
-            "reply_hex": None,
-            "flags": None,
-            "reply_kind": None,
-            "flags_access": None,
-            "response_state": None,
-            "ebusd_name": None,
-            "myvaillant_name": None,
-            "raw_hex": None,
-            "type": None,
-            "value": None,
-            # VE18-R2: Sanitise — strip endpoint details from error text.
-            "error": f"transport_error: {type(exc).__name__}",
-        }
-
-    if len(response) == 0:
-        return {
-            "read_opcode": read_opcode,
-            "read_opcode_label": read_opcode_label,
-            "reply_hex": "",
-            "flags": None,
-            "reply_kind": None,
-            "flags_access": None,
-            "response_state": "empty_reply",
-            "ebusd_name": None,
-            "myvaillant_name": None,
-            "raw_hex": None,
-            "type": None,
-            "value": None,
-            "error": None,
-        }
-
-    reply_hex = response.hex()
-    flags: int | None = response[0] if response else None
-    reply_kind = _reply_kind(flags, response_len=len(response), opcode=opcode)
-    flags_access: str | None = (
-        _interpret_flags(flags, response_len=len(response), opcode=opcode)
-        if flags is not None
-        else None
-    )
+        # VE18-R2: Sanitise — strip endpoint details from error text.
+        return base | {"error": f"transport_error: {type(exc).__name__}"}
+
+    # One length read drives the dispatch: 0 = empty reply, 1 = status-only,
+    # otherwise the echo header is validated (and short replies rejected) below.
+    response_len = len(response)
+    if response_len == 0:
+        return base | {"reply_hex": "", "response_state": "empty_reply"}
+
+    flags = response[0]
+    active = base | {
+        "reply_hex": response.hex(),
+        "flags": flags,
+        "reply_kind": _reply_kind(flags, response_len=response_len, opcode=opcode),
+        "flags_access": _interpret_flags(flags, response_len=response_len, opcode=opcode),
+        "response_state": "active",
+    }
 
     # Some registers respond with a single status byte (no GG/RR echo and no value bytes).
     # We treat this as a valid "absent register" reply rather than a decoder bug.
-    if len(response) == 1:
-        return {
-            "read_opcode": read_opcode,
-            "read_opcode_label": read_opcode_label,
-            "reply_hex": reply_hex,
-            "flags": flags,
-            "reply_kind": reply_kind,
-            "flags_access": flags_access,
-            "response_state": "active",
-            "ebusd_name": None,
-            "myvaillant_name": None,
-            "raw_hex": None,
-            "type": None,
-            "value": None,
-            "error": None,
-        }
+    if response_len == 1:
+        return active
 
     try:
         value_bytes = _strip_echo_header(payload, response)
     except ValueError as exc:
-        return {
-            "read_opcode": read_opcode,
-            "read_opcode_label": read_opcode_label,
-            "reply_hex": reply_hex,
-            "flags": flags,
-            "reply_kind": reply_kind,
-            "flags_access": flags_access,
-            "response_state": "active",
-            "ebusd_name": None,
-            "myvaillant_name": None,
-            "raw_hex": None,
-            "type": None,
-            "value": None,
-            "error": f"decode_error: {exc}",
-        }
+        return active | {"error": f"decode_error: {exc}"}
 
     raw_hex = value_bytes.hex()
     if type_hint is not None:
         try:
-            value = parse_typed_value(type_hint, value_bytes)
-            typed_entry: RegisterEntry = {
-                "read_opcode": read_opcode,
-                "read_opcode_label": read_opcode_label,
-                "reply_hex": reply_hex,
-                "flags": flags,
-                "reply_kind": reply_kind,
-                "flags_access": flags_access,
-                "response_state": "active",
-                "ebusd_name": None,
-                "myvaillant_name": None,
-                "raw_hex": raw_hex,
-                "type": type_hint,
-                "value": value,
-                "error": None,
-            }
-            sentinel_display = _sentinel_value_display(
-                value=value,
-                raw_hex=raw_hex,
-                value_type=type_hint,
-            )
-            if sentinel_display is not None:
-                typed_entry["value_display"] = sentinel_display
-            return typed_entry
+            value = typed_value_parser(type_hint)(value_bytes)
         except ValueParseError as exc:
-            return {
-                "read_opcode": read_opcode,
-                "read_opcode_label": read_opcode_label,
-                "reply_hex": reply_hex,
-                "flags": flags,
-                "reply_kind": reply_kind,
-                "flags_access": flags_access,
-                "response_state": "active",
-                "ebusd_name": None,
-                "myvaillant_name": None,
+            return active | {
                 "raw_hex": raw_hex,
                 "type": type_hint,
-                "value": None,
                 "error": f"parse_error: {exc}",
             }
+        typed_entry = active | {"raw_hex": raw_hex, "type": type_hint, "value": value}
+        sentinel_display = _sentinel_value_display(
+            value=value,
+            raw_hex=raw_hex,
+            value_type=type_hint,
+        )
+        if sentinel_display is not None:
+            typed_entry["value_display"] = sentinel_display
+        return typed_entry
 
     inferred_type, inferred_value, inferred_error = _parse_inferred_value(value_bytes)
-    entry: RegisterEntry = {
-        "read_opcode": read_opcode,
-        "read_opcode_label": read_opcode_label,
-        "reply_hex": reply_hex,
-        "flags": flags,
-        "reply_kind": reply_kind,
-        "flags_access": flags_access,
-        "response_state": "active",
-        "ebusd_name": None,
-        "myvaillant_name": None,
+    entry = active | {
         "raw_hex": raw_hex,
         "type": inferred_type,
         "value": inferred_value,
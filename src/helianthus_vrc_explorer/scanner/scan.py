@@ -3,13 +3,15 @@ from __future__ import annotations
 import contextlib
 import math
 import os
+import select
 import struct
 import sys
 import time
 from collections import deque
 from collections.abc import Mapping, Sequence
-from dataclasses import asdict, dataclass
-from datetime import UTC, datetime
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from itertools import chain
 from typing import Any, Final, Literal, cast
 
 from rich.console import Console
@@ -53,8 +55,8 @@ from .plan import (
     GroupScanPlan,
     PlanKey,
     RegisterTask,
-    build_work_queue,
     estimate_register_requests,
+    iter_work_queue,
     make_plan_key,
 )
 from .register import (
@@ -89,6 +91,16 @@ _UNKNOWN_GROUP_OPCODE_CANDIDATES: tuple[RegisterOpcode, ...] = (
     _REMOTE_REGISTER_OPCODE,
 )
 
+# Constraint entry bodies (opcode 0x01), decoded in place after the 4-byte reply header.
+_CONSTRAINT_BODY_OFFSET: Final = 4
+_CONSTRAINT_U16_RANGE: Final = struct.Struct("<HHH")
+_CONSTRAINT_F32_RANGE: Final = struct.Struct("<fff")
+_CONSTRAINT_U16: Final = struct.Struct("<H")
+
+# Consecutive constraint-probe transport failures (before any decoded entry)
+# after which a group is treated as not answering opcode 0x01.
+_CONSTRAINT_PROBE_MAX_CONSECUTIVE_ERRORS: Final = 16
+
 PlannerUiMode = Literal["disabled", "auto", "textual", "classic"]
 _KNOWN_DESCRIPTOR_TYPES = frozenset(
     float(desc) for config in GROUP_CONFIG.values() if (desc := config.get("desc")) is not None
@@ -302,25 +314,22 @@ def _operation_plan_meta(group_plan: GroupScanPlan) -> tuple[str, dict[str, obje
 
 
 def _scan_plan_meta_groups(plan: dict[PlanKey, GroupScanPlan]) -> dict[str, object]:
-    serializable: dict[str, object] = {}
-    grouped: dict[int, list[GroupScanPlan]] = {}
-    for _key, group_plan in sorted(plan.items()):
-        grouped.setdefault(group_plan.group, []).append(group_plan)
+    # One to_meta() per namespace, visited in (group, opcode) order.
+    grouped: dict[int, dict[str, dict[str, object]]] = {}
+    for group_plan in sorted(plan.values(), key=lambda gp: (gp.group, gp.opcode)):
+        op_key, payload = _operation_plan_meta(group_plan)
+        grouped.setdefault(group_plan.group, {})[op_key] = payload
 
-    for group in sorted(grouped):
-        group_plans = sorted(grouped[group], key=lambda gp: gp.opcode)
+    serializable: dict[str, object] = {}
+    for group, op_meta in grouped.items():
         group_key = _hex_u8(group)
-        op_meta: dict[str, object] = {}
-        for group_plan in group_plans:
-            op_key, payload = _operation_plan_meta(group_plan)
-            op_meta[op_key] = payload
-        if len(group_plans) > 1:
+        if len(op_meta) > 1:
             serializable[group_key] = {
                 "multi_op": True,
                 "operations": op_meta,
             }
             continue
-        _, single_payload = _operation_plan_meta(group_plans[0])
+        (single_payload,) = op_meta.values()
         serializable[group_key] = {
             **single_payload,
             "multi_op": False,
@@ -489,33 +498,38 @@ def _record_namespace_topology(
         group_obj["ii_max"] = _hex_u8(ii_max)
 
 
-def _present_instances_for_opcode(
+def _task_register_map(
     artifact: dict[str, Any],
     *,
-    group: int,
-    opcode: int,
-) -> tuple[int, ...]:
-    op_hex = _hex_u8(opcode)
-    group_key = _hex_u8(group)
-    op_obj = artifact["operations"].get(op_hex)
-    if not isinstance(op_obj, dict):
-        return ()
-    op_groups = op_obj.get("groups")
-    if not isinstance(op_groups, dict):
-        return ()
-    group_obj = op_groups.get(group_key)
-    if not isinstance(group_obj, dict):
-        return ()
-    instances_obj = group_obj.get("instances")
-    if not isinstance(instances_obj, dict):
-        return ()
-    return tuple(
-        sorted(
-            int(ii_key, 0)
-            for (ii_key, ii_obj) in instances_obj.items()
-            if isinstance(ii_obj, dict) and ii_obj.get("present") is True
-        )
+    task: RegisterTask,
+    metadata_map: Mapping[int, GroupMetadata],
+) -> dict[str, Any] | None:
+    """Return the artifact `registers` dict for a task's instance, creating the path."""
+
+    _ensure_group_artifact(
+        artifact,
+        group=task.group,
+        opcode=task.opcode,
+        name="Unknown",
+        descriptor_observed=0.0,
     )
+    task_group_meta = metadata_map.get(task.group)
+    if task_group_meta is not None:
+        _record_namespace_topology(
+            artifact,
+            group=task.group,
+            opcode=task.opcode,
+            ii_max=_ii_max_for_opcode(
+                group=task.group,
+                default_ii_max=task_group_meta.ii_max,
+                opcode=task.opcode,
+            ),
+        )
+    instances_obj = _instances_object(artifact, group=task.group, opcode=task.opcode)
+    instance_obj = instances_obj.setdefault(_hex_u8(task.instance), {"present": False})
+    if not isinstance(instance_obj, dict):
+        return None
+    return cast(dict[str, Any], instance_obj.setdefault("registers", {}))
 
 
 def _mark_present_instances(instances_obj: dict[str, Any], *, instances: tuple[int, ...]) -> None:
@@ -698,14 +712,11 @@ def _decode_constraint_date(value: bytes) -> str:
     month = value[1]
     year = 2000 + value[2]
     try:
-        import datetime as _dt_mod
-
-        _dt_mod.date(year, month, day)
+        return date(year, month, day).isoformat()
     except ValueError as exc:
         raise ValueError(
             f"Invalid date triplet: {value.hex()} ({year:04d}-{month:02d}-{day:02d})"
         ) from exc
-    return f"{year:04d}-{month:02d}-{day:02d}"
 
 
 def _parse_constraint_entry(
@@ -714,20 +725,21 @@ def _parse_constraint_entry(
     register: int,
     response: bytes,
 ) -> ConstraintEntry:
-    if len(response) < 4:
-        raise ValueError(f"Short constraint response: expected >=4 bytes, got {len(response)}")
+    off = _CONSTRAINT_BODY_OFFSET
+    if len(response) < off:
+        raise ValueError(f"Short constraint response: expected >={off} bytes, got {len(response)}")
 
     tt = response[0]
     if response[1] != group or response[2] != register:
         raise ValueError(
             "Constraint header mismatch: "
-            f"expected_gg={group:02x} expected_rr={register:02x} got={response[:4].hex()}"
+            f"expected_gg={group:02x} expected_rr={register:02x} got={response[:off].hex()}"
         )
-    body = response[4:]
+    body_len = len(response) - off
     if tt == 0x06:
-        if len(body) < 3:
-            raise ValueError(f"TT=0x06 expects >=3 body bytes, got {len(body)}")
-        min_u8, max_u8, step_u8 = body[0], body[1], body[2]
+        if body_len < 3:
+            raise ValueError(f"TT=0x06 expects >=3 body bytes, got {body_len}")
+        min_u8, max_u8, step_u8 = response[off], response[off + 1], response[off + 2]
         return ConstraintEntry(
             tt=tt,
             kind="u8_range",
@@ -737,11 +749,9 @@ def _parse_constraint_entry(
             raw_hex=response.hex(),
         )
     if tt == 0x09:
-        if len(body) < 6:
-            raise ValueError(f"TT=0x09 expects >=6 body bytes, got {len(body)}")
-        min_u16 = int.from_bytes(body[0:2], byteorder="little", signed=False)
-        max_u16 = int.from_bytes(body[2:4], byteorder="little", signed=False)
-        step_u16 = int.from_bytes(body[4:6], byteorder="little", signed=False)
+        if body_len < 6:
+            raise ValueError(f"TT=0x09 expects >=6 body bytes, got {body_len}")
+        min_u16, max_u16, step_u16 = _CONSTRAINT_U16_RANGE.unpack_from(response, off)
         return ConstraintEntry(
             tt=tt,
             kind="u16_range",
@@ -751,11 +761,9 @@ def _parse_constraint_entry(
             raw_hex=response.hex(),
         )
     if tt == 0x0F:
-        if len(body) < 12:
-            raise ValueError(f"TT=0x0F expects >=12 body bytes, got {len(body)}")
-        min_f32 = struct.unpack("<f", body[0:4])[0]
-        max_f32 = struct.unpack("<f", body[4:8])[0]
-        step_f32 = struct.unpack("<f", body[8:12])[0]
+        if body_len < 12:
+            raise ValueError(f"TT=0x0F expects >=12 body bytes, got {body_len}")
+        min_f32, max_f32, step_f32 = _CONSTRAINT_F32_RANGE.unpack_from(response, off)
         return ConstraintEntry(
             tt=tt,
             kind="f32_range",
@@ -765,11 +773,11 @@ def _parse_constraint_entry(
             raw_hex=response.hex(),
         )
     if tt == 0x0C:
-        if len(body) < 9:
-            raise ValueError(f"TT=0x0C expects >=9 body bytes, got {len(body)}")
-        min_date = _decode_constraint_date(body[0:3])
-        max_date = _decode_constraint_date(body[3:6])
-        step_days = int.from_bytes(body[6:8], byteorder="little", signed=False)
+        if body_len < 9:
+            raise ValueError(f"TT=0x0C expects >=9 body bytes, got {body_len}")
+        min_date = _decode_constraint_date(response[off : off + 3])
+        max_date = _decode_constraint_date(response[off + 3 : off + 6])
+        (step_days,) = _CONSTRAINT_U16.unpack_from(response, off + 6)
         return ConstraintEntry(
             tt=tt,
             kind="date_range",
@@ -789,18 +797,38 @@ def _probe_group_constraints(
     rr_max: int,
     observer: ScanObserver | None,
     progress_phase: str | None = None,
+    max_consecutive_errors: int | None = _CONSTRAINT_PROBE_MAX_CONSECUTIVE_ERRORS,
 ) -> dict[int, ConstraintEntry]:
-    """Probe `01 GG RR` entries for one group and return decoded constraints."""
+    """Probe `01 GG RR` entries for one group and return decoded constraints.
+
+    Absent entries still get a (status-only) reply, so when the first
+    `max_consecutive_errors` probes all fail at the transport the group does not
+    answer opcode 0x01 and the remaining probes are skipped. Any reply, including
+    a status-only one, disables this early exit. Pass `None` to always probe the
+    full window.
+    """
 
     constraints: dict[int, ConstraintEntry] = {}
 
     probe_rr_max = min(rr_max, 0xFF)
-    rr_candidates = list(range(0x00, probe_rr_max + 1))
     # Observed shared constraint IDs may live above the per-group RR scan window.
-    if probe_rr_max < 0x80:
-        rr_candidates.append(0x80)
+    rr_candidates = (
+        chain(range(0x00, probe_rr_max + 1), (0x80,))
+        if probe_rr_max < 0x80
+        else range(0x00, probe_rr_max + 1)
+    )
+    remaining = probe_rr_max + 1 + (1 if probe_rr_max < 0x80 else 0)
+    unanswered = 0
+    replied = False
 
     for rr in rr_candidates:
+        if (
+            max_consecutive_errors is not None
+            and not replied
+            and unanswered >= max_consecutive_errors
+        ):
+            break
+        remaining -= 1
         try:
             if observer is not None:
                 observer.status(f"Probe constraints GG=0x{group:02X} RR=0x{rr:02X}")
@@ -810,9 +838,12 @@ def _probe_group_constraints(
             except TransportError as exc:
                 if isinstance(exc, TransportCommandNotEnabled):
                     raise
+                unanswered += 1
                 continue
             except Exception:
+                unanswered += 1
                 continue
+            replied = True
             try:
                 parsed = _parse_constraint_entry(group=group, register=rr, response=response)
             except Exception:
@@ -822,6 +853,15 @@ def _probe_group_constraints(
             if observer is not None and progress_phase is not None:
                 observer.phase_advance(progress_phase, advance=1)
 
+    if remaining and observer is not None:
+        observer.log(
+            f"GG=0x{group:02X} constraint probe stopped after {unanswered} "
+            f"unanswered probes; skipped {remaining} probes",
+            level="warn",
+        )
+        if progress_phase is not None:
+            observer.phase_advance(progress_phase, advance=remaining)
+
     if observer is not None and constraints:
         observer.log(
             f"GG=0x{group:02X} constraint_dictionary entries: {len(constraints)}",
@@ -831,27 +871,22 @@ def _probe_group_constraints(
 
 
 def _metadata_map_to_dict(metadata_map: dict[int, GroupMetadata]) -> dict[str, Any]:
-    serializable: dict[str, Any] = {}
-    for group, meta in sorted(metadata_map.items()):
-        payload = asdict(meta)
-        rr_max = payload["rr_max"]
-        ii_max = payload["ii_max"]
-        if isinstance(rr_max, int):
-            payload["rr_max"] = _hex_u16(rr_max)
-        if isinstance(ii_max, int):
-            payload["ii_max"] = _hex_u8(ii_max)
-        serializable[_hex_u8(group)] = payload
-    return serializable
+    return {
+        _hex_u8(group): {
+            "rr_max": _hex_u16(meta.rr_max),
+            "ii_max": None if meta.ii_max is None else _hex_u8(meta.ii_max),
+            "source": meta.source,
+        }
+        for group, meta in sorted(metadata_map.items())
+    }
 
 
 def _constraint_map_to_dict(
     constraint_map: dict[int, dict[int, ConstraintEntry]],
 ) -> dict[str, Any]:
-    serializable: dict[str, Any] = {}
-    for group, rr_map in sorted(constraint_map.items()):
-        group_obj: dict[str, Any] = {}
-        for register, entry in sorted(rr_map.items()):
-            group_obj[_hex_u8(register)] = {
+    return {
+        _hex_u8(group): {
+            _hex_u8(register): {
                 "tt": _hex_u8(entry.tt),
                 "type": entry.kind,
                 "min": entry.min_value,
@@ -862,8 +897,10 @@ def _constraint_map_to_dict(
                 "scope": entry.scope,
                 "provenance": entry.provenance,
             }
-        serializable[_hex_u8(group)] = group_obj
-    return serializable
+            for register, entry in sorted(rr_map.items())
+        }
+        for group, rr_map in sorted(constraint_map.items())
+    }
 
 
 def _constraint_catalog_entry_count(catalog: StaticConstraintCatalog) -> int:
@@ -879,8 +916,8 @@ def _constraint_for_register(
     live_constraints: dict[int, dict[int, ConstraintEntry]],
     static_constraints: StaticConstraintCatalog,
 ) -> ConstraintEntry | StaticConstraintEntry | None:
-    live = live_constraints.get(group, {}).get(register)
-    if live is not None:
+    live_group = live_constraints.get(group)
+    if live_group is not None and (live := live_group.get(register)) is not None:
         return live
     return lookup_static_constraint(
         static_constraints,
@@ -965,25 +1002,6 @@ def _constraint_mismatch_reason(
     return None
 
 
-def _entry_has_valid_value(entry: RegisterEntry) -> bool:
-    """Return True when a register read produced a meaningful value.
-
-    Used for opcode selection (0x02 vs 0x06) in ambiguous cases.
-    """
-
-    if entry.get("error") is not None:
-        return False
-    if entry.get("flags_access") == "absent":
-        return False
-    raw_hex = entry.get("raw_hex")
-    if raw_hex in (None, ""):
-        return False
-    value = entry.get("value")
-    if value is None:
-        return False
-    return not (isinstance(value, float) and math.isnan(value))
-
-
 def _entry_int_value(entry: Mapping[str, Any] | None) -> int | None:
     if not isinstance(entry, Mapping):
         return None
@@ -997,12 +1015,19 @@ def _entry_int_value(entry: Mapping[str, Any] | None) -> int | None:
     return None
 
 
+_HEATING_CIRCUIT_TYPE_NAMES: Final[dict[int, tuple[str, str]]] = {
+    1: ("DIRECT_HEATING_CIRCUIT", "DIRECT_HEATING_CIRCUIT"),
+    2: ("MIXER_CIRCUIT_EXTERNAL", "MIXER_CIRCUIT_EXTERNAL"),
+}
+_ROOM_INFLUENCE_TYPE_NAMES: Final[dict[int, tuple[str, str]]] = {
+    0: ("INACTIVE", "INACTIVE"),
+    1: ("ACTIVE", "ACTIVE"),
+    2: ("EXTENDED", "EXTENDED"),
+}
+
+
 def _resolve_heating_circuit_type_name(raw_value: int) -> tuple[str, str]:
-    mapping = {
-        1: ("DIRECT_HEATING_CIRCUIT", "DIRECT_HEATING_CIRCUIT"),
-        2: ("MIXER_CIRCUIT_EXTERNAL", "MIXER_CIRCUIT_EXTERNAL"),
-    }
-    return mapping.get(
+    return _HEATING_CIRCUIT_TYPE_NAMES.get(
         raw_value,
         (f"UNKNOWN_{raw_value}", f"UNKNOWN_{raw_value}"),
     )
@@ -1034,17 +1059,18 @@ def _resolve_mixer_circuit_type_name(
 
 
 def _resolve_room_influence_type_name(raw_value: int) -> tuple[str, str]:
-    mapping = {
-        0: ("INACTIVE", "INACTIVE"),
-        1: ("ACTIVE", "ACTIVE"),
-        2: ("EXTENDED", "EXTENDED"),
-    }
-    return mapping.get(
+    return _ROOM_INFLUENCE_TYPE_NAMES.get(
         raw_value,
         (f"UNKNOWN_{raw_value}", f"UNKNOWN_{raw_value}"),
     )
 
 
+def _set_enum_annotation(entry: dict[str, Any], raw_name: str, resolved_name: str) -> None:
+    entry["enum_raw_name"] = raw_name
+    entry["enum_resolved_name"] = resolved_name
+    entry["value_display"] = f"{raw_name} ({resolved_name})"
+
+
 def _apply_contextual_enum_annotations(artifact: dict[str, Any]) -> None:
     # v2.3: look up GG=0x02 under OP=0x02
     op_02 = artifact.get("operations", {}).get(_hex_u8(_LOCAL_REGISTER_OPCODE))
@@ -1086,44 +1112,29 @@ def _apply_contextual_enum_annotations(artifact: dict[str, Any]) -> None:
             if not isinstance(registers, dict):
                 continue
 
-            cooling_enabled = (
-                _entry_int_value(registers.get("0x0006"))
-                if isinstance(registers.get("0x0006"), dict)
-                else None
-            )
+            # _entry_int_value() already returns None for missing or malformed entries.
+            cooling_enabled = _entry_int_value(registers.get("0x0006"))
 
             rr01 = registers.get("0x0001")
-            if isinstance(rr01, dict):
-                raw_value = _entry_int_value(rr01)
-                if raw_value is not None:
-                    raw_name, resolved_name = _resolve_heating_circuit_type_name(raw_value)
-                    rr01["enum_raw_name"] = raw_name
-                    rr01["enum_resolved_name"] = resolved_name
-                    rr01["value_display"] = f"{raw_name} ({resolved_name})"
+            if isinstance(rr01, dict) and (raw_value := _entry_int_value(rr01)) is not None:
+                _set_enum_annotation(rr01, *_resolve_heating_circuit_type_name(raw_value))
 
             rr02 = registers.get("0x0002")
-            if isinstance(rr02, dict):
-                raw_value = _entry_int_value(rr02)
-                if raw_value is not None:
-                    raw_name, resolved_name = _resolve_mixer_circuit_type_name(
+            if isinstance(rr02, dict) and (raw_value := _entry_int_value(rr02)) is not None:
+                _set_enum_annotation(
+                    rr02,
+                    *_resolve_mixer_circuit_type_name(
                         raw_value,
                         cooling_enabled=cooling_enabled,
                         gg05_present=gg05_present,
                         system_schema=system_schema,
                         pool_sensor_present=pool_sensor_present,
-                    )
-                    rr02["enum_raw_name"] = raw_name
-                    rr02["enum_resolved_name"] = resolved_name
-                    rr02["value_display"] = f"{raw_name} ({resolved_name})"
+                    ),
+                )
 
             rr03 = registers.get("0x0003")
-            if isinstance(rr03, dict):
-                raw_value = _entry_int_value(rr03)
-                if raw_value is not None:
-                    raw_name, resolved_name = _resolve_room_influence_type_name(raw_value)
-                    rr03["enum_raw_name"] = raw_name
-                    rr03["enum_resolved_name"] = resolved_name
-                    rr03["value_display"] = f"{raw_name} ({resolved_name})"
+            if isinstance(rr03, dict) and (raw_value := _entry_int_value(rr03)) is not None:
+                _set_enum_annotation(rr03, *_resolve_room_influence_type_name(raw_value))
 
 
 def _resolve_planner_mode(
@@ -1201,18 +1212,13 @@ class _PlannerHotkeyReader(contextlib.AbstractContextManager["_PlannerHotkeyRead
         if not self._active or self._fd is None:
             return False
         try:
-            import select  # noqa: PLC0415
-
             ready, _w, _x = select.select([sys.stdin], [], [], 0.0)
             if not ready:
                 return False
             raw = os.read(self._fd, 1)
         except (OSError, ValueError):
             return False
-        if not raw:
-            return False
-        ch = raw.decode("utf-8", errors="ignore").lower()
-        return ch == "p"
+        return raw in (b"p", b"P")
 
     @contextlib.contextmanager
     def suspend(self) -> Any:
@@ -1258,6 +1264,7 @@ def scan_b524(
     static_constraints, static_constraints_source = load_default_b524_constraints_catalog()
 
     counting_transport = CountingTransport(transport)
+    send_counters = counting_transport.counters
     transport = counting_transport
 
     artifact: dict[str, Any] = {
@@ -1318,7 +1325,7 @@ def scan_b524(
             observer.phase_start("group_discovery", total=0x100)
         emit_trace_label(transport, "Discovering Groups")
         group_discovery_start = time.perf_counter()
-        group_discovery_start_calls = counting_transport.counters.send_calls
+        group_discovery_start_calls = send_counters.send_calls
         discovered = discover_groups(transport, dst=dst, observer=observer)
 
         # Exhaustive mode: inject synthetic DiscoveredGroup entries for any GG in
@@ -1338,16 +1345,16 @@ def scan_b524(
                         )
 
         group_discovery_duration_s = time.perf_counter() - group_discovery_start
-        group_discovery_requests = (
-            counting_transport.counters.send_calls - group_discovery_start_calls
-        )
+        group_discovery_requests = send_counters.send_calls - group_discovery_start_calls
         classified = classify_groups(discovered, observer=observer)
         unknown_descriptor_types = sorted(
             {
-                float(group.descriptor)
+                descriptor
                 for group in classified
-                if not math.isnan(group.descriptor)
-                and float(group.descriptor) not in _KNOWN_DESCRIPTOR_TYPES
+                # ClassifiedGroup.descriptor is already a float; known types are the
+                # common case, so test membership before the NaN check.
+                if (descriptor := group.descriptor) not in _KNOWN_DESCRIPTOR_TYPES
+                and not math.isnan(descriptor)
             }
         )
         if unknown_descriptor_types and observer is not None:
@@ -1386,13 +1393,14 @@ def scan_b524(
                 observer.log("Probing opcode 0x01 constraint dictionary", level="info")
             emit_trace_label(transport, "Constraint Dictionary Probe")
 
-            probe_total = 0
-            for group in classified:
-                group_meta = metadata_map[group.group]
-                rr_max = min(group_meta.rr_max, 0xFF)
-                probe_total += rr_max + 1
-                if rr_max < 0x80:
-                    probe_total += 1
+            # (group, probe rr_max) per group; the total mirrors the RR window
+            # _probe_group_constraints walks, including the shared 0x80 entry.
+            probe_work = [
+                (group.group, min(metadata_map[group.group].rr_max, 0xFF)) for group in classified
+            ]
+            probe_total = sum(
+                rr_max + 1 + (1 if rr_max < 0x80 else 0) for _gg, rr_max in probe_work
+            )
             if observer is not None:
                 observer.log(
                     f"Live constraint probe will add up to {probe_total} extra requests.",
@@ -1401,18 +1409,17 @@ def scan_b524(
                 observer.phase_start("constraint_probe", total=probe_total or 1)
 
             try:
-                for group in classified:
-                    group_meta = metadata_map[group.group]
+                for probe_group, probe_rr_max in probe_work:
                     constraints = _probe_group_constraints(
                         transport,
                         dst=dst,
-                        group=group.group,
-                        rr_max=group_meta.rr_max,
+                        group=probe_group,
+                        rr_max=probe_rr_max,
                         observer=observer,
                         progress_phase="constraint_probe",
                     )
                     if constraints:
-                        constraint_map[group.group] = constraints
+                        constraint_map[probe_group] = constraints
             except KeyboardInterrupt:
                 # VE32: Preserve partial constraint results, then re-raise
                 # so the outer handler sets meta.incomplete=true.
@@ -1584,9 +1591,12 @@ def scan_b524(
             observer.phase_start("instance_discovery", total=instance_total or 1)
 
         instance_discovery_start = time.perf_counter()
-        instance_discovery_start_calls = counting_transport.counters.send_calls
+        instance_discovery_start_calls = send_counters.send_calls
         known_namespace_probe_counts: dict[int, list[str]] = {}
         unknown_namespace_probe_counts: dict[int, list[str]] = {}
+        # Sorted present slots per namespace, kept alongside the artifact's "0xII"-keyed
+        # instance objects so planning does not parse the keys back into ints.
+        present_instances_by_namespace: dict[PlanKey, tuple[int, ...]] = {}
         for group, meta, opcode in instance_targets:
             rr_max = meta.rr_max
             config = GROUP_CONFIG.get(group.group)
@@ -1620,6 +1630,9 @@ def scan_b524(
                     expand_fallback=research_mode,
                 )
                 _mark_present_instances(instances_obj, instances=present_instances)
+                present_instances_by_namespace[_plan_key(group.group, opcode)] = tuple(
+                    sorted(present_instances)
+                )
                 unknown_namespace_probe_counts.setdefault(group.group, []).append(
                     f"{opcode_label(opcode)} {len(present_instances)}/{total_slots}"
                 )
@@ -1647,6 +1660,7 @@ def scan_b524(
                 )
             if not _is_instanced_group(namespace_ii_max):
                 _mark_present_instances(instances_obj, instances=(0x00,))
+                present_instances_by_namespace[_plan_key(group.group, opcode)] = (0x00,)
                 known_namespace_probe_counts.setdefault(group.group, []).append(
                     f"{_group_name_for_opcode(group.group, opcode)} [{opcode_label(opcode)}] 1/1"
                 )
@@ -1671,8 +1685,9 @@ def scan_b524(
                 opcode=opcode,
                 probes=probes,
             )
-            present_instances = tuple(ii for ii, probe in probes.items() if probe.present)
+            present_instances = tuple(ii for ii, probe in sorted(probes.items()) if probe.present)
             _mark_present_instances(instances_obj, instances=present_instances)
+            present_instances_by_namespace[_plan_key(group.group, opcode)] = present_instances
             known_namespace_probe_counts.setdefault(group.group, []).append(
                 f"{_group_name_for_opcode(group.group, opcode)} "
                 f"[{opcode_label(opcode)}] "
@@ -1703,9 +1718,7 @@ def scan_b524(
         if observer is not None:
             observer.phase_finish("instance_discovery")
         instance_discovery_duration_s = time.perf_counter() - instance_discovery_start
-        instance_discovery_requests = (
-            counting_transport.counters.send_calls - instance_discovery_start_calls
-        )
+        instance_discovery_requests = send_counters.send_calls - instance_discovery_start_calls
 
         # Interactive scan planner (TTY only): allow users to trim the register scan scope.
         plan: dict[PlanKey, GroupScanPlan] = {}
@@ -1717,10 +1730,8 @@ def scan_b524(
                     default_ii_max=meta.ii_max,
                     opcode=opcode,
                 )
-                present_instances = _present_instances_for_opcode(
-                    artifact,
-                    group=group.group,
-                    opcode=opcode,
+                present_instances = present_instances_by_namespace.get(
+                    _plan_key(group.group, opcode), ()
                 )
                 plan[_plan_key(group.group, opcode)] = GroupScanPlan(
                     group=group.group,
@@ -1760,10 +1771,8 @@ def scan_b524(
                         opcode=opcode,
                     )
                 )
-                present_instances = _present_instances_for_opcode(
-                    artifact,
-                    group=group.group,
-                    opcode=opcode,
+                present_instances = present_instances_by_namespace.get(
+                    _plan_key(group.group, opcode), ()
                 )
                 if planner_ii_max is None and not present_instances:
                     present_instances = (0x00,)
@@ -1801,7 +1810,6 @@ def scan_b524(
 
         if planner_mode != "disabled" and console is not None and observer is not None:
             with observer.suspend():
-                planner_default_plan = dict(plan)
                 if planner_mode == "textual":
                     try:
                         from ..ui.planner_textual import run_textual_scan_plan
@@ -1820,7 +1828,7 @@ def scan_b524(
                             selected = run_textual_scan_plan(
                                 planner_groups,
                                 request_rate_rps=request_rate_rps,
-                                default_plan=planner_default_plan,
+                                default_plan=plan,
                                 default_preset=planner_preset,
                             )
                         except Exception as exc:
@@ -1842,7 +1850,7 @@ def scan_b524(
                         console,
                         planner_groups,
                         request_rate_rps=request_rate_rps,
-                        default_plan=planner_default_plan,
+                        default_plan=plan,
                         default_preset=planner_preset,
                     )
 
@@ -1858,7 +1866,9 @@ def scan_b524(
 
         # Phase D: register scan (supports interactive replanning).
         done: set[RegisterTask] = set()
-        work_queue = deque(build_work_queue(plan, done=done))
+        work_queue = deque(iter_work_queue(plan, done=done))
+        # (opcode, group, instance) -> artifact "registers" dict, resolved on first write.
+        register_maps: dict[tuple[int, int, int], dict[str, Any]] = {}
         if observer is not None:
             observer.phase_start("register_scan", total=len(work_queue) or 1)
         emit_trace_label(transport, "Register Scan")
@@ -1925,7 +1935,7 @@ def scan_b524(
                     artifact["meta"]["scan_plan"]["estimated_register_requests"] = (
                         estimate_register_requests(plan)
                     )
-                    work_queue = deque(build_work_queue(plan, done=done))
+                    work_queue = deque(iter_work_queue(plan, done=done))
                     observer.phase_set_total(
                         "register_scan",
                         total=(len(done) + len(work_queue)) or 1,
@@ -1967,6 +1977,8 @@ def scan_b524(
                     if ebusd_schema is not None
                     else None
                 )
+                # read_register() always reports task.opcode as read_opcode, so this
+                # pre-read entry also annotates the result below.
                 myvaillant_entry = (
                     myvaillant_map.lookup(
                         group=task.group,
@@ -1994,32 +2006,18 @@ def scan_b524(
                 )
                 if schema_entry is not None:
                     entry["ebusd_name"] = schema_entry.name
-                if myvaillant_map is not None:
-                    lookup_opcode: int | None = None
-                    read_opcode = entry.get("read_opcode")
-                    if isinstance(read_opcode, str):
-                        try:
-                            lookup_opcode = int(read_opcode, 0)
-                        except ValueError:
-                            lookup_opcode = None
-                    mv = myvaillant_map.lookup(
-                        group=task.group,
-                        instance=task.instance,
-                        register=task.register,
-                        opcode=lookup_opcode,
-                    )
-                    if mv is not None:
-                        entry["myvaillant_name"] = mv.leaf
-                        if mv.register_class is not None:
-                            entry["register_class"] = mv.register_class
-                        if entry.get("ebusd_name") is None:
-                            mapped_ebusd_name = mv.resolved_ebusd_name(
-                                group=task.group,
-                                instance=task.instance,
-                                register=task.register,
-                            )
-                            if mapped_ebusd_name:
-                                entry["ebusd_name"] = mapped_ebusd_name
+                if myvaillant_entry is not None:
+                    entry["myvaillant_name"] = myvaillant_entry.leaf
+                    if myvaillant_entry.register_class is not None:
+                        entry["register_class"] = myvaillant_entry.register_class
+                    if entry.get("ebusd_name") is None:
+                        mapped_ebusd_name = myvaillant_entry.resolved_ebusd_name(
+                            group=task.group,
+                            instance=task.instance,
+                            register=task.register,
+                        )
+                        if mapped_ebusd_name:
+                            entry["ebusd_name"] = mapped_ebusd_name
 
                 constraint = _constraint_for_register(
                     opcode=task.opcode,
@@ -2054,34 +2052,13 @@ def scan_b524(
                         )
                 done.add(task)
 
-                _ensure_group_artifact(
-                    artifact,
-                    group=task.group,
-                    opcode=task.opcode,
-                    name="Unknown",
-                    descriptor_observed=0.0,
-                )
-                task_group_meta = metadata_map.get(task.group)
-                if task_group_meta is not None:
-                    _record_namespace_topology(
-                        artifact,
-                        group=task.group,
-                        opcode=task.opcode,
-                        ii_max=_ii_max_for_opcode(
-                            group=task.group,
-                            default_ii_max=task_group_meta.ii_max,
-                            opcode=task.opcode,
-                        ),
-                    )
-                instances_obj = _instances_object(
-                    artifact,
-                    group=task.group,
-                    opcode=task.opcode,
-                )
-                instance_key = _hex_u8(task.instance)
-                instance_obj = instances_obj.setdefault(instance_key, {"present": False})
-                if isinstance(instance_obj, dict):
-                    registers = instance_obj.setdefault("registers", {})
+                register_map_key = (task.opcode, task.group, task.instance)
+                registers = register_maps.get(register_map_key)
+                if registers is None:
+                    registers = _task_register_map(artifact, task=task, metadata_map=metadata_map)
+                    if registers is not None:
+                        register_maps[register_map_key] = registers
+                if registers is not None:
                     registers[_hex_u16(task.register)] = entry
 
         _apply_contextual_enum_annotations(artifact)
@@ -137,7 +137,7 @@ class EbusdCsvSchema:
                     continue
 
                 try:
-                    selector = parse_b524_id(f"b524,{id_hex}")
+                    selector = parse_b524_id(id_hex)
                 except Exception:
                     continue
 
@@ -177,3 +177,12 @@ class EbusdCsvSchema:
 
     def lookup_b509(self, *, register: int) -> EbusdRegisterSchemaEntry | None:
         return self._b509_reads.get(register)
+
+    def lookup_b509_range(self, start: int, end: int) -> list[EbusdRegisterSchemaEntry | None]:
+        """Return B509 schema entries for `start..end` (inclusive).
+
+        Entries are indexed by `register - start`.
+        """
+
+        get = self._b509_reads.get
+        return [get(register) for register in range(start, end + 1)]
@@ -125,3 +125,10 @@ def test_parse_b524_id_constraint_example() -> None:
 def test_parse_b524_id_errors(id_hex: str, exc_type: type[Exception]) -> None:
     with pytest.raises(exc_type):
         parse_b524_id(id_hex)
+
+
+def test_parse_b524_id_interns_equal_selectors() -> None:
+    first = parse_b524_id("b524,020003001600")
+    second = parse_b524_id("0x020003001600")
+    assert first is second
+    assert parse_b524_id("060003001600") is not first
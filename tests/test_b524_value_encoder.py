@@ -69,3 +69,12 @@ def test_encode_hex_enforces_length() -> None:
 def test_encode_unknown_type_raises() -> None:
     with pytest.raises(ValueEncodeError, match=r"Unknown type spec"):
         encode_typed_value("NOPE", 1)
+
+
+@pytest.mark.parametrize(
+    ("type_spec", "value"),
+    [("UIN", True), ("UCH", 1.0), ("EXP", False), ("BOOL", 1)],
+)
+def test_encode_rejects_wrong_python_type(type_spec: str, value: object) -> None:
+    with pytest.raises(ValueEncodeError, match=rf"{type_spec} expects"):
+        encode_typed_value(type_spec, value)
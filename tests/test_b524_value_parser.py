@@ -1,6 +1,11 @@
 import pytest
 
-from helianthus_vrc_explorer.protocol.parser import ValueParseError, parse_typed_value
+from helianthus_vrc_explorer.protocol.parser import (
+    ValueParseError,
+    fixed_value_length,
+    parse_typed_value,
+    typed_value_parser,
+)
 
 
 def test_parse_exp_float32le() -> None:
@@ -114,3 +119,56 @@ def test_parse_malformed_values_raise(type_spec: str, data_hex: str) -> None:
 def test_parse_unknown_type_raises() -> None:
     with pytest.raises(ValueParseError, match=r"Unknown type spec"):
         parse_typed_value("FOO", b"")
+
+
+def test_parse_type_spec_is_normalized_before_dispatch() -> None:
+    assert parse_typed_value(" uin ", bytes.fromhex("3412")) == 0x1234
+    assert parse_typed_value("hda:3", bytes.fromhex("09031a")) == "2026-03-09"
+
+
+@pytest.mark.parametrize("data_hex", ["0000c07f", "0100807f", "ffffffff", "0000c0ff"])
+def test_parse_exp_nan_payloads_are_none(data_hex: str) -> None:
+    assert parse_typed_value("EXP", bytes.fromhex(data_hex)) is None
+
+
+def test_parse_exp_infinity_is_not_nan() -> None:
+    assert parse_typed_value("EXP", bytes.fromhex("0000807f")) == float("inf")
+
+
+@pytest.mark.parametrize(
+    ("data_hex", "message"),
+    [
+        ("2a0000", r"invalid BCD for hour"),
+        ("240000", r"hour must be 0\.\.23"),
+        ("006000", r"minute must be 0\.\.59"),
+        ("00005a", r"invalid BCD for second"),
+    ],
+)
+def test_parse_hti_reports_offending_field(data_hex: str, message: str) -> None:
+    with pytest.raises(ValueParseError, match=message):
+        parse_typed_value("HTI", bytes.fromhex(data_hex))
+
+
+def test_parse_hda3_leap_day() -> None:
+    assert parse_typed_value("HDA:3", bytes.fromhex("1d0218")) == "2024-02-29"
+    assert parse_typed_value("HDA:3", bytes.fromhex("1d0200")) == "2000-02-29"
+    with pytest.raises(ValueParseError, match=r"invalid date DDMMYY=290225"):
+        parse_typed_value("HDA:3", bytes.fromhex("1d0219"))
+    with pytest.raises(ValueParseError, match=r"invalid date DDMMYY=310426"):
+        parse_typed_value("HDA:3", bytes.fromhex("1f041a"))
+
+
+@pytest.mark.parametrize(
+    ("type_spec", "expected"),
+    [("EXP", 4), ("uin", 2), ("HEX:5", 5), ("HTI", 3), ("STR:*", None), ("HEX:x", None)],
+)
+def test_fixed_value_length(type_spec: str, expected: int | None) -> None:
+    assert fixed_value_length(type_spec) == expected
+
+
+def test_typed_value_parser_binds_hex_length() -> None:
+    parser = typed_value_parser("hex:2")
+    assert parser is typed_value_parser("hex:2")
+    assert parser(bytes.fromhex("3412")) == "0x3412"
+    with pytest.raises(ValueParseError, match=r"HEX:2 expects 2 bytes"):
+        parser(b"\x00")
@@ -3,7 +3,9 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+from helianthus_vrc_explorer.scanner.b509 import scan_b509
 from helianthus_vrc_explorer.scanner.scan import scan_vrc
+from helianthus_vrc_explorer.schema.ebusd_csv import EbusdCsvSchema, EbusdRegisterSchemaEntry
 from helianthus_vrc_explorer.transport.base import (
     TransportError,
     TransportInterface,
@@ -131,3 +133,46 @@ def test_scan_vrc_keeps_b509_when_first_directory_probe_is_status_only(tmp_path:
     assert isinstance(b509_dump, dict)
     devices = b509_dump["devices"]
     assert devices["0x15"]["registers"]["0x2700"]["reply_hex"] == "00"
+
+
+def test_scan_b509_strips_status_byte_only_when_length_requires_it(tmp_path: Path) -> None:
+    replies = {
+        0x2700: bytes.fromhex("3412"),
+        0x2701: bytes.fromhex("003412"),
+        0x2702: bytes.fromhex("073412"),
+    }
+
+    class _Transport(_HybridTransport):
+        def send_proto(
+            self,
+            dst: int,
+            primary: int,
+            secondary: int,
+            payload: bytes,
+            *,
+            expect_response: bool = True,
+        ) -> bytes:
+            return replies[(payload[1] << 8) | payload[2]]
+
+    schema = EbusdCsvSchema(
+        exact={},
+        wildcard_instance={},
+        b509_reads={
+            register: EbusdRegisterSchemaEntry(name=f"Reg{register:04X}", type_spec="UIN")
+            for register in replies
+        },
+    )
+    artifact = scan_b509(
+        _Transport(_write_fixture_group_02(tmp_path)),
+        dst=0x15,
+        ranges=[(0x2700, 0x2702)],
+        ebusd_schema=schema,
+    )
+
+    regs = artifact["devices"]["0x15"]["registers"]
+    assert regs["0x2700"]["value"] == 0x1234
+    assert regs["0x2701"]["value"] == 0x1234
+    assert regs["0x2701"]["reply_hex"] == "003412"
+    assert regs["0x2702"]["value"] is None
+    assert regs["0x2702"]["error"] == "parse_error: UIN expects 2 bytes, got 3 bytes"
+    assert artifact["meta"]["error_count"] == 1
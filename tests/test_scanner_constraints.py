@@ -5,9 +5,27 @@ import pytest
 from helianthus_vrc_explorer.scanner.scan import (
     ConstraintEntry,
     _parse_constraint_entry,
+    _probe_group_constraints,
     _resolve_mixer_circuit_type_name,
     _resolve_room_influence_type_name,
 )
+from helianthus_vrc_explorer.transport.base import TransportInterface, TransportTimeout
+
+
+class _ConstraintTimeoutTransport(TransportInterface):
+    """Answers only the given constraint probes; everything else times out."""
+
+    def __init__(self, replies: dict[int, bytes] | None = None) -> None:
+        self.replies = replies or {}
+        self.probed: list[int] = []
+
+    def send(self, dst: int, payload: bytes) -> bytes:  # noqa: ARG002
+        register = payload[2]
+        self.probed.append(register)
+        reply = self.replies.get(register)
+        if reply is None:
+            raise TransportTimeout("no reply")
+        return reply
 
 
 @pytest.mark.parametrize(
@@ -54,6 +72,28 @@ def test_parse_constraint_entry_rejects_header_mismatch() -> None:
         _parse_constraint_entry(group=0x03, register=0x02, response=response)
 
 
+@pytest.mark.parametrize(
+    ("response_hex", "message"),
+    [
+        ("060102000001", "TT=0x06 expects >=3 body bytes, got 2"),
+        ("090202000000040001", "TT=0x09 expects >=6 body bytes, got 5"),
+        ("0f030200000070410000f0410000", "TT=0x0F expects >=12 body bytes, got 10"),
+        ("0c0303000101011f0c6301", "TT=0x0C expects >=9 body bytes, got 7"),
+    ],
+)
+def test_parse_constraint_entry_rejects_truncated_body(response_hex: str, message: str) -> None:
+    response = bytes.fromhex(response_hex)
+    with pytest.raises(ValueError, match=message):
+        _parse_constraint_entry(group=response[1], register=response[2], response=response)
+
+
+def test_parse_constraint_entry_rejects_invalid_date_triplet() -> None:
+    # Max date 2099-02-30 does not exist.
+    response = bytes.fromhex("0c0303000101011e0263010000")
+    with pytest.raises(ValueError, match=r"Invalid date triplet: 1e0263 \(2099-02-30\)"):
+        _parse_constraint_entry(group=0x03, register=0x03, response=response)
+
+
 def test_parse_constraint_entry_rejects_unsupported_tt() -> None:
     response = bytes.fromhex("01020200000004000100")
     with pytest.raises(ValueError, match="Unsupported constraint TT"):
@@ -95,3 +135,56 @@ def test_resolve_room_influence_type_name_rules() -> None:
     assert _resolve_room_influence_type_name(0) == ("INACTIVE", "INACTIVE")
     assert _resolve_room_influence_type_name(1) == ("ACTIVE", "ACTIVE")
     assert _resolve_room_influence_type_name(2) == ("EXTENDED", "EXTENDED")
+
+
+def test_probe_group_constraints_stops_on_unresponsive_group() -> None:
+    transport = _ConstraintTimeoutTransport()
+
+    constraints = _probe_group_constraints(
+        transport, dst=0x15, group=0x02, rr_max=0x25, observer=None
+    )
+
+    assert constraints == {}
+    assert transport.probed == list(range(16))
+
+
+def test_probe_group_constraints_early_exit_can_be_disabled() -> None:
+    transport = _ConstraintTimeoutTransport()
+
+    _probe_group_constraints(
+        transport,
+        dst=0x15,
+        group=0x02,
+        rr_max=0x25,
+        observer=None,
+        max_consecutive_errors=None,
+    )
+
+    assert transport.probed == [*range(0x26), 0x80]
+
+
+def test_probe_group_constraints_keeps_probing_after_a_decoded_entry() -> None:
+    transport = _ConstraintTimeoutTransport({0x00: bytes.fromhex("06020000000101")})
+
+    constraints = _probe_group_constraints(
+        transport, dst=0x15, group=0x02, rr_max=0x25, observer=None
+    )
+
+    assert list(constraints) == [0x00]
+    assert transport.probed == [*range(0x26), 0x80]
+
+
+def test_probe_group_constraints_status_only_reply_disables_early_exit() -> None:
+    transport = _ConstraintTimeoutTransport(
+        {
+            0x00: bytes.fromhex("00"),
+            0x20: bytes.fromhex("06022000000101"),
+        }
+    )
+
+    constraints = _probe_group_constraints(
+        transport, dst=0x15, group=0x02, rr_max=0x25, observer=None
+    )
+
+    assert list(constraints) == [0x20]
+    assert transport.probed == [*range(0x26), 0x80]
@@ -9,6 +9,7 @@ from helianthus_vrc_explorer.scanner.plan import (
     estimate_register_requests,
     format_int_set,
     format_plan_key,
+    iter_work_queue,
     make_plan_key,
     parse_int_set,
     parse_int_token,
@@ -30,6 +31,8 @@ def test_parse_int_token_accepts_decimal_and_hex() -> None:
         ("1,3,5", [1, 3, 5]),
         ("0-3,7,9-10", [0, 1, 2, 3, 7, 9, 10]),
         ("3-1", [1, 2, 3]),
+        ("5-8,0-2,2-6,7", [0, 1, 2, 3, 4, 5, 6, 7, 8]),
+        ("4,4,1-2,2", [1, 2, 4]),
     ],
 )
 def test_parse_int_set(spec: str, expected: list[int]) -> None:
@@ -39,6 +42,8 @@ def test_parse_int_set(spec: str, expected: list[int]) -> None:
 def test_parse_int_set_rejects_out_of_range() -> None:
     with pytest.raises(ValueError, match="out of range"):
         parse_int_set("256", min_value=0, max_value=255)
+    with pytest.raises(ValueError, match=r"out of range: 256 "):
+        parse_int_set("250-300", min_value=0, max_value=255)
 
 
 def test_estimate_register_requests() -> None:
@@ -56,6 +61,17 @@ def test_estimate_register_requests() -> None:
     # GG=0x02: 2 instances * (3+1) regs = 8
     # GG=0x01: 1 instance * (1+1) regs = 2
     assert estimate_register_requests(plan) == 10
+    assert plan[make_plan_key(0x02, 0x02)].request_count == 8
+
+
+def test_group_scan_plan_to_meta_formats_out_of_range_bytes_as_is() -> None:
+    plan = GroupScanPlan(group=0x02, opcode=0x02, rr_max=0x0003, instances=(0x00, 0xFF, -1))
+
+    assert plan.to_meta() == {
+        "opcode": "0x02",
+        "rr_max": "0x0003",
+        "instances": ["0x00", "0xff", "0x-1"],
+    }
 
 
 def test_format_int_set_compacts_ranges() -> None:
@@ -81,6 +97,22 @@ def test_build_work_queue_skips_done_tasks() -> None:
     ]
 
 
+def test_iter_work_queue_is_lazy_and_matches_build_work_queue() -> None:
+    plan = {
+        make_plan_key(0x03, 0x02): GroupScanPlan(
+            group=0x03, opcode=0x02, rr_max=0x0001, instances=(0x00, 0x01)
+        ),
+        make_plan_key(0x02, 0x06): GroupScanPlan(
+            group=0x02, opcode=0x06, rr_max=0x0000, instances=(0x00,)
+        ),
+    }
+    done = {RegisterTask(group=0x03, opcode=0x02, instance=0x01, register=0x0000)}
+    tasks = iter_work_queue(plan, done=done)
+    assert not isinstance(tasks, list)
+    assert list(tasks) == build_work_queue(plan, done=done)
+    assert len(build_work_queue(plan, done=done)) == 4
+
+
 def test_format_seconds_normalizes_boundaries() -> None:
     assert _format_seconds(480.0) == "8m"
     assert _format_seconds(481.0) == "8m 1s"
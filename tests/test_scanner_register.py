@@ -121,6 +121,18 @@ def test_read_register_nack_returns_nack_response_state() -> None:
     assert entry["raw_hex"] is None
 
 
+def test_read_register_entries_are_independent_copies() -> None:
+    transport = _AlwaysNackTransport()
+
+    first = read_register(transport, 0x15, 0x06, group=0x09, instance=0x00, register=0x0001)
+    first["ebusd_name"] = "annotated"
+    second = read_register(transport, 0x15, 0x06, group=0x09, instance=0x01, register=0x0001)
+
+    assert second["ebusd_name"] is None
+    assert second["read_opcode"] == "0x06"
+    assert second["read_opcode_label"] == "ReadDeviceSlotRegister"
+
+
 def test_read_register_command_not_enabled_is_fatal() -> None:
     transport = _AlwaysCommandNotEnabledTransport()
 
@@ -328,6 +340,15 @@ def test_flags_interpretation_multi_byte() -> None:
     assert _interpret_flags(0x01, response_len=7) == "state_stable"
     assert _interpret_flags(0x02, response_len=7) == "config_installer"
     assert _interpret_flags(0x03, response_len=7) == "config_user"
+    assert _interpret_flags(0x04, response_len=7) == "unknown"
+
+
+def test_flags_interpretation_remote_opcode() -> None:
+    assert _interpret_flags(0x00, response_len=7, opcode=0x06) == "invalid"
+    assert _interpret_flags(0x01, response_len=7, opcode=0x06) == "valid"
+    assert _interpret_flags(0x02, response_len=7, opcode=0x06) == "config_sentinel"
+    assert _interpret_flags(0x03, response_len=7, opcode=0x06) == "config_valid"
+    assert _interpret_flags(0x80, response_len=7, opcode=0x06) == "unknown"
 
 
 def test_opcodes_for_group_dual_namespace() -> None:
@@ -868,6 +889,26 @@ def test_fw_not_added_to_inferred_type_selection() -> None:
     assert inferred_error is None
 
 
+@pytest.mark.parametrize(
+    ("value_hex", "expected_type"),
+    [
+        ("4142430000", "STR:*"),  # "ABC" + NUL padding
+        ("41e9000000", "STR:*"),  # latin1 0xE9 is printable
+        ("0041420000", "HEX:5"),  # empty string before the first NUL
+        ("4142004300", "HEX:5"),  # data after the terminator
+        ("41421f0000", "HEX:5"),  # control byte in the prefix
+        ("4142434445", "HEX:5"),  # no terminator at all
+    ],
+)
+def test_parse_inferred_value_only_treats_nul_terminated_latin1_as_string(
+    value_hex: str, expected_type: str
+) -> None:
+    inferred_type, _value, inferred_error = _parse_inferred_value(bytes.fromhex(value_hex))
+
+    assert inferred_type == expected_type
+    assert inferred_error is None
+
+
 # -- B524 reply binding: _strip_echo_header validation tests --
 
 
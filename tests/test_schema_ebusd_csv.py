@@ -25,3 +25,15 @@ def test_ebusd_csv_schema_parses_b509_register_rows(tmp_path: Path) -> None:
     # First match wins to keep deterministic behavior with duplicate rows.
     assert entry.name == "SystemWaterPressure"
     assert entry.type_spec == "EXP"
+
+
+def test_ebusd_csv_schema_lookup_b509_range_is_indexed_by_offset(tmp_path: Path) -> None:
+    csv_path = tmp_path / "schema.csv"
+    csv_path.write_text("x,x,x,SystemWaterPressure,b509,0d2739,EXP\n", encoding="utf-8")
+
+    schema = EbusdCsvSchema.from_path(csv_path)
+    entries = schema.lookup_b509_range(0x2738, 0x273A)
+    assert len(entries) == 3
+    assert entries[0] is None
+    assert entries[1] is schema.lookup_b509(register=0x2739)
+    assert entries[2] is None